@@ -1,5 +1,6 @@
 import pandas as pd
 from _vendor.pdpy as pdpy
+from sl_core.utils.name_cleaning import get_parties_from_pdpy_df
 
 
 def load_mppartymemb_pypd(mppartymemb_fname: str = None):
@@ -32,23 +33,6 @@ def get_party_df_from_pdpy(
     return mppartymemb_df
 
 
-# Function to determine party based on name
-def get_party_from_pdpy_df(pdpydf, name):
-    if pdpydf is not None:
-        party = pdpydf.loc[pdpydf["First_Last_Name"] == name,
-                           "party_name"].values
-        if party.size > 0:
-            return party[0]
-        else:
-            party = pdpydf.loc[pdpydf["display_name"] == name,
-                               "party_name"].values
-            if party.size > 0:
-                return party[0]
-        return "Unknown"
-    else:
-        return "Issue with PdPy data"
-
-
 def clean_political_party_data():
     # Load MP party memberships data
     load_mppartymemb_pypd()
@@ -69,9 +53,8 @@ def clean_political_party_data():
         axis=1,
     )
     # Assign PoliticalParty based off PdpY data
-    df["PoliticalParty_pdpy"] = df.apply(
-        lambda row: get_party_from_pdpy_df(pdpydf, row["CleanedName"]),
-        axis=1,
+    df["PoliticalParty_pdpy"] = get_parties_from_pdpy_df(
+        pdpydf, df["CleanedName"]
     )
     # Save final dataset
     final_file_path = st.session_state.mp_party_memberships_file_path
@@ -5,6 +5,7 @@ from the ONS API and save to CSV.
 import requests
 import pandas as pd
 import logging
+import os
 from pathlib import Path
 
 logging.basicConfig(level=logging.INFO)
@@ -17,9 +18,11 @@ DATASET_NAME = "Generational income: The effects of taxes and benefits"
 
 def _most_recent_extract_dir() -> Path:
     """Return the most recent extract directory, or create a new one."""
-    extract_dirs = [p for p in OUTPUT_DIR.iterdir() if p.is_dir() and p.name.startswith("extract_")]
+    # scandir gets the entry type from the listing, so only extract_ dirs are stat()ed
+    with os.scandir(OUTPUT_DIR) as entries:
+        extract_dirs = [e for e in entries if e.name.startswith("extract_") and e.is_dir()]
     if extract_dirs:
-        return max(extract_dirs, key=lambda p: p.stat().st_mtime)
+        return Path(max(extract_dirs, key=lambda e: e.stat().st_mtime).path)
     
     ts = pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")
     new_dir = OUTPUT_DIR / f"extract_{ts}"
@@ -5,6 +5,7 @@ Reads from ons_datasets.csv to find the dataset and uses its URL directly.
 import requests
 import pandas as pd
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -16,9 +17,11 @@ DATA_DIR = Path(__file__).parent
 
 def _most_recent_extract_dir() -> Path:
     """Return the most recent extract directory, or create a new one."""
-    extract_dirs = [p for p in DATA_DIR.iterdir() if p.is_dir() and p.name.startswith("extract_")]
+    # scandir gets the entry type from the listing, so only extract_ dirs are stat()ed
+    with os.scandir(DATA_DIR) as entries:
+        extract_dirs = [e for e in entries if e.name.startswith("extract_") and e.is_dir()]
     if extract_dirs:
-        return max(extract_dirs, key=lambda p: p.stat().st_mtime)
+        return Path(max(extract_dirs, key=lambda e: e.stat().st_mtime).path)
     
     ts = pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")
     new_dir = DATA_DIR / f"extract_{ts}"
@@ -165,6 +165,7 @@ def load_icd_file(xlsx_path, year_range=None):
     """Load ICD files reliably, merging all relevant sheets (2+ for ICD2–ICD6, 3+ for ICD7+)."""
     logger.info(f"Loading {xlsx_path.name}")
 
+    # Sheets are parsed from this one ExcelFile rather than reopening the path
     xls = pd.ExcelFile(xlsx_path)
     dfs = []
 
@@ -177,7 +178,7 @@ def load_icd_file(xlsx_path, year_range=None):
     for sheet_name in data_sheets:
         try:
             # First attempt: standard parse with inferred header
-            df = pd.read_excel(xlsx_path, sheet_name=sheet_name)
+            df = xls.parse(sheet_name=sheet_name)
             if df is not None and len(df) > 0:
                 # detect year columns in a case-insensitive way
                 year_cols = [c for c in df.columns if isinstance(c, str) and ('yr' in c.lower() or 'year' in c.lower())]
@@ -189,10 +190,10 @@ def load_icd_file(xlsx_path, year_range=None):
                         continue
 
             # Second attempt: read without headers and detect header row
-            df_no_header = pd.read_excel(xlsx_path, sheet_name=sheet_name, header=None)
+            df_no_header = xls.parse(sheet_name=sheet_name, header=None)
             header_row = _detect_header_row(df_no_header)
             if header_row is not None:
-                df2 = pd.read_excel(xlsx_path, sheet_name=sheet_name, header=header_row)
+                df2 = xls.parse(sheet_name=sheet_name, header=header_row)
                 parsed2 = _clean_and_filter_years(df2, year_range)
                 if not parsed2.empty:
                     logger.debug(
@@ -89,7 +89,7 @@ def extract_descriptions_from_xlsx(filepath):
             logger.warning(f"No description sheet found in {filepath.name}")
             return pd.DataFrame()
 
-        df = pd.read_excel(filepath, sheet_name=desc_sheet)
+        df = xls.parse(sheet_name=desc_sheet)
         logger.info(f"Extracted {len(df)} descriptions from {filepath.name}")
         return df
 
@@ -134,7 +134,7 @@ def load_icd_file(xlsx_path, year_range=None):
 
     for sheet_name in data_sheets:
         try:
-            df = pd.read_excel(xlsx_path, sheet_name=sheet_name)
+            df = xls.parse(sheet_name=sheet_name)
             if df.empty or len(df) < 2:
                 continue
 
@@ -378,7 +378,7 @@ def _load_configured_source(spec: dict) -> pd.DataFrame:
                 ]
             for sheet in target_sheets:
                 try:
-                    sheet_df = pd.read_excel(path, sheet_name=sheet)
+                    sheet_df = xls.parse(sheet_name=sheet)
                     if not sheet_df.empty:
                         sheet_df["_sheet"] = sheet
                         dfs.append(sheet_df)
@@ -4,7 +4,8 @@ Calculate UK mortality rates per 100,000 population by cause and age group.
 Inputs:
 - uk_mortality_by_cause_1901_onwards.zip (preferred; cause/sex/age ranges by year)
 - uk_mortality_comprehensive_1901_2025_harmonized.csv (fallback if zip is missing)
-- uk_population_harmonized_age_groups.csv (population by sex, harmonized age group, year)
+- uk_population_harmonized_age_groups.parquet (population by sex, harmonized age group, year;
+  falls back to the .csv copy if the Parquet file is missing)
 
 Outputs (all explicitly labelled to avoid denominator confusion):
 - uk_mortality_rates_per_100k_by_cause.zip (compressed)
@@ -43,7 +44,8 @@ DEV_DIR = Path(__file__).parent
 MORTALITY_DIR = DEV_DIR.parent  # data_sources/mortality_stats
 ROOT_DIR = MORTALITY_DIR.parent  # data_sources
 POPULATION_DIR = ROOT_DIR / "population"
-POPULATION_FILE = POPULATION_DIR / "uk_population_harmonized_age_groups.csv"
+POPULATION_FILE = POPULATION_DIR / "uk_population_harmonized_age_groups.parquet"
+FALLBACK_POPULATION_FILE = POPULATION_DIR / "uk_population_harmonized_age_groups.csv"
 PREFERRED_MORTALITY_FILE = MORTALITY_DIR / "uk_mortality_by_cause_1901_onwards.zip"
 FALLBACK_MORTALITY_FILE = MORTALITY_DIR / "uk_mortality_comprehensive_1901_2025_harmonized.csv"
 
@@ -114,9 +116,13 @@ def load_data():
     )
 
     # Load population
-    pop_file = POPULATION_FILE
+    # Prefer the Parquet copy (typed, no CSV parse); fall back to the CSV
+    pop_file = POPULATION_FILE if POPULATION_FILE.exists() else FALLBACK_POPULATION_FILE
     logger.info(f"Loading population: {pop_file.name}")
-    population = pd.read_csv(pop_file)
+    if pop_file.suffix == ".parquet":
+        population = pd.read_parquet(pop_file)
+    else:
+        population = pd.read_csv(pop_file)
     logger.info(
         f"  ✓ {len(population):,} records ({population['year'].min()}-{population['year'].max()})"
     )
@@ -46,7 +46,7 @@ for filename in icd_files:
                     break
 
             if desc_sheet:
-                df = pd.read_excel(filepath, sheet_name=desc_sheet)
+                df = xls.parse(sheet_name=desc_sheet)
                 print(f"\nDescription sheet: {desc_sheet}")
                 print(f"Columns: {df.columns.tolist()}")
                 print(f"Rows: {len(df)}")
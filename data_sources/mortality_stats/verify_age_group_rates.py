@@ -4,6 +4,7 @@ Verify age-group mortality rates and demonstrate denominator clarity.
 Runs quick sanity checks and shows examples of proper interpretation.
 """
 
+import io
 import pandas as pd
 import zipfile
 from pathlib import Path
@@ -36,13 +37,18 @@ def check_files_exist():
 
 
 def load_by_cause_from_zip():
-    """Load by_cause data from zip file."""
+    """Load by_cause data from zip file.
+
+    The member is read (and decompressed) into one in-memory buffer so the
+    CSV parser works on contiguous bytes instead of pulling chunks from the
+    zip stream.
+    """
     with zipfile.ZipFile(BY_CAUSE, 'r') as zf:
         csv_names = [n for n in zf.namelist() if n.lower().endswith('.csv')]
         if not csv_names:
             raise FileNotFoundError(f"No CSV found in {BY_CAUSE}")
-        with zf.open(csv_names[0]) as f:
-            return pd.read_csv(f)
+        data = zf.read(csv_names[0])
+    return pd.read_csv(io.BytesIO(data))
 
 
 def load_and_summarize():
@@ -75,26 +81,34 @@ def load_and_summarize():
     return by_cause, by_age, yearly
 
 
-def demonstrate_age_comparison(by_age):
-    """Show mortality differences across age groups."""
+def demonstrate_age_comparison(by_age_by_year):
+    """Show mortality differences across age groups.
+
+    ``by_age_by_year`` maps each year to its slice of the by-age-group table,
+    so the example year is a dict lookup rather than a full-table mask.
+    """
     print("\n" + "=" * 70)
     print("EXAMPLE 1: Compare Mortality Across Age Groups (Year 2000)")
     print("=" * 70)
     print("\nMale mortality rates per 100,000 [OF THAT AGE GROUP]:\n")
     
-    year_2000 = by_age[(by_age['year'] == 2000) & (by_age['sex'] == 'Male')]
+    year_2000 = by_age_by_year[2000]
+    year_2000 = year_2000[year_2000['sex'] == 'Male']
     year_2000 = year_2000.sort_values('mortality_rate_per_100k_age_group_population')
     
-    for _, row in year_2000.iterrows():
-        rate = row['mortality_rate_per_100k_age_group_population']
-        age = row['age_group']
-        pop = row['population_age_group']
-        deaths = row['deaths']
+    rows = zip(
+        year_2000['age_group'].to_numpy(),
+        year_2000['mortality_rate_per_100k_age_group_population'].to_numpy(),
+        year_2000['population_age_group'].to_numpy(),
+        year_2000['deaths'].to_numpy(),
+    )
+    for age, rate, pop, deaths in rows:
         print(f"  {age:>6} age: {rate:>9.1f} per 100k  ({deaths:>5} deaths / {pop:>11,.0f} population)")
     
     # Show ratio
-    youngest = year_2000[year_2000['age_group'] == '0-4']['mortality_rate_per_100k_age_group_population'].values[0]
-    oldest = year_2000[year_2000['age_group'] == '85+']['mortality_rate_per_100k_age_group_population'].values[0]
+    rates_by_age = year_2000.set_index('age_group')['mortality_rate_per_100k_age_group_population']
+    youngest = rates_by_age.loc['0-4']
+    oldest = rates_by_age.loc['85+']
     ratio = oldest / youngest
     
     print(f"\n  → 85+ mortality is {ratio:.1f}× higher than 0-4 age group")
@@ -115,11 +129,11 @@ def demonstrate_cause_comparison(by_cause):
     ]
     year_2000_elderly = year_2000_elderly.nlargest(5, 'mortality_rate_per_100k_age_group_population')
     
-    for i, (_, row) in enumerate(year_2000_elderly.iterrows(), 1):
-        rate = row['mortality_rate_per_100k_age_group_population']
-        cause = row['cause']
-        deaths = row['deaths']
-        pop = row['population_age_group']
+    for i, row in enumerate(year_2000_elderly.itertuples(index=False), 1):
+        rate = row.mortality_rate_per_100k_age_group_population
+        cause = row.cause
+        deaths = row.deaths
+        pop = row.population_age_group
         print(f"  {i}. Cause {cause}: {rate:>9.1f} per 100k  ({deaths:>5} deaths / {pop:>11,.0f} 85+ males)")
     
     print(f"\n  → All rates use same denominator: 85+ male population")
@@ -133,17 +147,19 @@ def demonstrate_yearly_trend(yearly):
     print("=" * 70)
     print("\nOverall mortality per 100,000 [TOTAL POPULATION, ALL AGES]:\n")
     
+    # Index by year once so each sample year is a direct label lookup
+    yearly = yearly.set_index('year')
+
     sample_years = [1901, 1950, 1975, 2000]
     for year in sample_years:
-        if year in yearly['year'].values:
-            row = yearly[yearly['year'] == year].iloc[0]
-            rate = row['mortality_rate_per_100k_total_population']
-            deaths = row['deaths']
-            pop = row['population_total']
+        if year in yearly.index:
+            rate = yearly.loc[year, 'mortality_rate_per_100k_total_population']
+            deaths = yearly.loc[year, 'deaths']
+            pop = yearly.loc[year, 'population_total']
             print(f"  {int(year)}: {rate:>9.1f} per 100k  ({deaths:>7,.0f} deaths / {pop:>12,.0f} total population)")
     
-    rate_1901 = yearly[yearly['year'] == 1901]['mortality_rate_per_100k_total_population'].values[0]
-    rate_2000 = yearly[yearly['year'] == 2000]['mortality_rate_per_100k_total_population'].values[0]
+    rate_1901 = yearly.loc[1901, 'mortality_rate_per_100k_total_population']
+    rate_2000 = yearly.loc[2000, 'mortality_rate_per_100k_total_population']
     improvement = (1 - rate_2000 / rate_1901) * 100
     
     print(f"\n  → Population mortality improved {improvement:.1f}% from 1901 to 2000")
@@ -188,8 +204,9 @@ def main():
         return False
     
     by_cause, by_age, yearly = load_and_summarize()
+    by_age_by_year = dict(iter(by_age.groupby('year', sort=False)))
     
-    demonstrate_age_comparison(by_age)
+    demonstrate_age_comparison(by_age_by_year)
     demonstrate_cause_comparison(by_cause)
     demonstrate_yearly_trend(yearly)
     show_denominator_warnings()
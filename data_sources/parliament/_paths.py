@@ -0,0 +1,33 @@
+# data_sources/parliament/_paths.py
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+
+@lru_cache(maxsize=32)
+def most_recent_extract_dir(base_dir: Path) -> Path:
+    """Return the most recent extract directory under base_dir (by mtime).
+
+    If none exist, create a new directory named `extract_<YYYYMMDD_HHMMSS>`.
+
+    The result is cached per base_dir for the life of the process; call
+    `most_recent_extract_dir.cache_clear()` to pick up directories created
+    elsewhere since the first lookup.
+    """
+    # scandir yields the entry type from the directory listing itself, so
+    # only the extract_ candidates need a stat() for their mtime.
+    with os.scandir(base_dir) as entries:
+        extract_dirs = [
+            (entry.stat().st_mtime, entry.path)
+            for entry in entries
+            if entry.name.startswith("extract_") and entry.is_dir()
+        ]
+    if extract_dirs:
+        return Path(max(extract_dirs)[1])
+
+    ts = pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")
+    new_dir = base_dir / f"extract_{ts}"
+    new_dir.mkdir(parents=True, exist_ok=True)
+    return new_dir
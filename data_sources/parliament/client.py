@@ -1,11 +1,17 @@
 # data_sources/parliament/client.py
+import threading
+
 from ._vendor.pypd import ParliamentApiClient
 
 _client = None
+_client_lock = threading.Lock()
 
 
 def get_client():
     global _client
     if _client is None:
-        _client = ParliamentApiClient()
+        # Extracts may fetch from several threads at once; only build one client.
+        with _client_lock:
+            if _client is None:
+                _client = ParliamentApiClient()
     return _client
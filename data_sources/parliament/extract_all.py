@@ -0,0 +1,71 @@
+# data_sources/parliament/extract_all.py
+"""
+Fetch MPs, Lords memberships and Parliament periods in one extract.
+
+The three API calls are independent and dominated by HTTP latency, so they
+are issued concurrently rather than one after another. Run as a module from
+the repository root:
+
+    python -m data_sources.parliament.extract_all
+"""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from ._paths import most_recent_extract_dir
+from .lords import get_lords_memberships
+from .mps import get_mps
+from .parliaments import get_parliament_periods
+
+
+BASE_DIR = Path(__file__).parent
+
+
+def fetch_all() -> dict[str, pd.DataFrame]:
+    """
+    Fetch the MPs, Lords and Parliament period tables concurrently.
+
+    Returns
+    -------
+    dict[str, pd.DataFrame]
+        Keyed by output file stem: "mps", "lords_memberships", "parliaments".
+    """
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        f_mps = ex.submit(get_mps)
+        f_lords = ex.submit(get_lords_memberships)
+        f_parls = ex.submit(get_parliament_periods)
+        return {
+            "mps": f_mps.result(),
+            "lords_memberships": f_lords.result(),
+            "parliaments": f_parls.result(),
+        }
+
+
+def main():
+    """Demo: fetch all Parliament tables and save them to the extract dir."""
+    print("Fetching MPs, Lords memberships and Parliament periods...")
+    try:
+        frames = fetch_all()
+    except Exception as e:
+        print(f"Error: {e}")
+        return
+
+    extract_dir = most_recent_extract_dir(BASE_DIR)
+    to_write = {name: df for name, df in frames.items() if len(df) > 0}
+    for name, df in frames.items():
+        print(f"Retrieved {len(df)} rows for {name}")
+
+    def _write(item):
+        name, df = item
+        output_file = extract_dir / f"{name}.csv"
+        df.to_csv(output_file, index=False)
+        return output_file
+
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        for output_file in ex.map(_write, to_write.items()):
+            print(f"✓ Data saved to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
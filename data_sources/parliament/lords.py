@@ -1,6 +1,16 @@
 # data_sources/parliament/lords.py
 import pandas as pd
 import pdpy
+from pathlib import Path
+
+try:
+    from ._paths import most_recent_extract_dir
+except ImportError:
+    # Run as a script from this directory (e.g. via lords_by_year.py)
+    from _paths import most_recent_extract_dir
+
+
+BASE_DIR = Path(__file__).parent
 
 
 def get_lords_memberships(
@@ -139,20 +149,6 @@ def get_lords_with_government(
     return lords_df
 
 
-def _most_recent_extract_dir():
-    """Return the most recent extract directory, or create a new one."""
-    from pathlib import Path
-    base_dir = Path(__file__).parent
-    extract_dirs = [p for p in base_dir.iterdir() if p.is_dir() and p.name.startswith("extract_")]
-    if extract_dirs:
-        return max(extract_dirs, key=lambda p: p.stat().st_mtime)
-    
-    ts = pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")
-    new_dir = base_dir / f"extract_{ts}"
-    new_dir.mkdir(parents=True, exist_ok=True)
-    return new_dir
-
-
 def main():
     """Demo usage of the functions."""
     print("Fetching House of Lords memberships...")
@@ -168,7 +164,7 @@ def main():
             print(lords_df.head(5).to_string())
 
             # Save to CSV in extract directory
-            extract_dir = _most_recent_extract_dir()
+            extract_dir = most_recent_extract_dir(BASE_DIR)
             output_file = extract_dir / "lords_memberships.csv"
             lords_df.to_csv(output_file, index=False)
             print(f"\n✓ Data saved to: {output_file}")
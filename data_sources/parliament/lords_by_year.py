@@ -10,29 +10,15 @@ import pandas as pd
 from pathlib import Path
 from typing import Optional
 from lords import get_lords_memberships
+from _paths import most_recent_extract_dir
 
 
 BASE_DIR = Path(__file__).parent
 
 
-def _most_recent_extract_dir() -> Path:
-    """Return the most recent extract directory under parliament (by mtime).
-
-    If none exist, create a new directory named `extract_<YYYYMMDD_HHMMSS>`.
-    """
-    extract_dirs = [p for p in BASE_DIR.iterdir() if p.is_dir() and p.name.startswith("extract_")]
-    if extract_dirs:
-        return max(extract_dirs, key=lambda p: p.stat().st_mtime)
-
-    ts = pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")
-    new_dir = BASE_DIR / f"extract_{ts}"
-    new_dir.mkdir(parents=True, exist_ok=True)
-    return new_dir
-
-
 def _load_latest_extract() -> Optional[pd.DataFrame]:
     """Load the most recent lords_memberships CSV if available."""
-    extract_dir = _most_recent_extract_dir()
+    extract_dir = most_recent_extract_dir(BASE_DIR)
     candidates = sorted(
         extract_dir.glob("lords_memberships*.csv"),
         key=lambda p: p.stat().st_mtime,
@@ -83,7 +69,7 @@ def get_lords_by_year(
     if lords_df is None:
         print("No cached extract found; refreshing via API...")
         lords_df = get_lords_memberships(from_date, to_date)
-        extract_dir = _most_recent_extract_dir()
+        extract_dir = most_recent_extract_dir(BASE_DIR)
         extract_path = extract_dir / "lords_memberships.csv"
         lords_df.to_csv(extract_path, index=False)
         print(f"Saved fresh extract to {extract_path}")
@@ -190,7 +176,7 @@ def main():
             print(lords_by_year_df.to_string(index=False))
             
             # Save to CSV in the same extract directory as the source data
-            extract_dir = _most_recent_extract_dir()
+            extract_dir = most_recent_extract_dir(BASE_DIR)
             output_file = extract_dir / "lords_by_year.csv"
             lords_by_year_df.to_csv(output_file, index=False)
             print(f"\n✓ Data saved to: {output_file}")
@@ -2,6 +2,10 @@
 import pandas as pd
 from pathlib import Path
 from .client import get_client
+from ._paths import most_recent_extract_dir
+
+
+BASE_DIR = Path(__file__).parent
 
 
 def get_mps() -> pd.DataFrame:
@@ -24,19 +28,6 @@ def get_mps() -> pd.DataFrame:
     return df
 
 
-def _most_recent_extract_dir() -> Path:
-    """Return the most recent extract directory, or create a new one."""
-    base_dir = Path(__file__).parent
-    extract_dirs = [p for p in base_dir.iterdir() if p.is_dir() and p.name.startswith("extract_")]
-    if extract_dirs:
-        return max(extract_dirs, key=lambda p: p.stat().st_mtime)
-    
-    ts = pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")
-    new_dir = base_dir / f"extract_{ts}"
-    new_dir.mkdir(parents=True, exist_ok=True)
-    return new_dir
-
-
 def main():
     """Demo: fetch and save MPs data."""
     print("Fetching House of Commons MPs...")
@@ -45,7 +36,7 @@ def main():
         print(f"Retrieved {len(mps_df)} MPs")
         
         if len(mps_df) > 0:
-            extract_dir = _most_recent_extract_dir()
+            extract_dir = most_recent_extract_dir(BASE_DIR)
             output_file = extract_dir / "mps.csv"
             mps_df.to_csv(output_file, index=False)
             print(f"✓ Data saved to: {output_file}")
@@ -2,6 +2,10 @@
 import pandas as pd
 from pathlib import Path
 from .client import get_client
+from ._paths import most_recent_extract_dir
+
+
+BASE_DIR = Path(__file__).parent
 
 
 def get_parliament_periods() -> pd.DataFrame:
@@ -15,25 +19,14 @@ def get_parliament_periods() -> pd.DataFrame:
     data = client.get_parliaments()
 
     df = pd.DataFrame(data)
-    df["start_date"] = pd.to_datetime(df["start_date"])
-    df["end_date"] = pd.to_datetime(df["end_date"])
+    # API dates are ISO 8601; naming the format keeps parsing off the
+    # per-element dateutil fallback.
+    df["start_date"] = pd.to_datetime(df["start_date"], format="ISO8601", cache=True)
+    df["end_date"] = pd.to_datetime(df["end_date"], format="ISO8601", cache=True)
 
     return df[["parliament_number", "start_date", "end_date"]]
 
 
-def _most_recent_extract_dir() -> Path:
-    """Return the most recent extract directory, or create a new one."""
-    base_dir = Path(__file__).parent
-    extract_dirs = [p for p in base_dir.iterdir() if p.is_dir() and p.name.startswith("extract_")]
-    if extract_dirs:
-        return max(extract_dirs, key=lambda p: p.stat().st_mtime)
-    
-    ts = pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")
-    new_dir = base_dir / f"extract_{ts}"
-    new_dir.mkdir(parents=True, exist_ok=True)
-    return new_dir
-
-
 def main():
     """Demo: fetch and save Parliament periods data."""
     print("Fetching Parliament periods...")
@@ -42,7 +35,7 @@ def main():
         print(f"Retrieved {len(parliaments_df)} Parliament periods")
         
         if len(parliaments_df) > 0:
-            extract_dir = _most_recent_extract_dir()
+            extract_dir = most_recent_extract_dir(BASE_DIR)
             output_file = extract_dir / "parliaments.csv"
             parliaments_df.to_csv(output_file, index=False)
             print(f"✓ Data saved to: {output_file}")
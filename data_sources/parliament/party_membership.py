@@ -1,6 +1,6 @@
 from ._vendor.pdpy import pdpy
-import pandas as pd
 from pathlib import Path
+from ._paths import most_recent_extract_dir
 
 """ Given dates returns a tidy DataFrame
 of UK MP's and their parties over time"""
@@ -48,19 +48,6 @@ def get_party_from_pdpy_df(pdpydf, name):
         return "Issue with PdPy data"
 
 
-def _most_recent_extract_dir() -> Path:
-    """Return the most recent extract directory, or create a new one."""
-    base_dir = Path(__file__).parent
-    extract_dirs = [p for p in base_dir.iterdir() if p.is_dir() and p.name.startswith("extract_")]
-    if extract_dirs:
-        return max(extract_dirs, key=lambda p: p.stat().st_mtime)
-    
-    ts = pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")
-    new_dir = base_dir / f"extract_{ts}"
-    new_dir.mkdir(parents=True, exist_ok=True)
-    return new_dir
-
-
 def main():
     """Demo: fetch and save MP party memberships data."""
     print("Fetching MP party memberships...")
@@ -69,7 +56,7 @@ def main():
         print(f"Retrieved {len(party_df)} party memberships")
         
         if len(party_df) > 0:
-            extract_dir = _most_recent_extract_dir()
+            extract_dir = most_recent_extract_dir(Path(__file__).parent)
             output_file = extract_dir / "mps_party_memberships.csv"
             party_df.to_csv(output_file, index=False)
             print(f"✓ Data saved to: {output_file}")
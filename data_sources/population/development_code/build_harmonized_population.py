@@ -5,57 +5,51 @@ Input:
   - combined_population_data.csv (1901-2000, detailed age ranges)
   - populations20012016.xls (2001-2016, age group format)
 Output: uk_population_harmonized_age_groups.csv (1901-2016, standardized age bins)
+        uk_population_harmonized_age_groups.parquet (same data, dtypes preserved)
 
 Age groups: 0-4, 5-14, 15-24, 25-34, 35-44, 45-54, 55-64, 65-74, 75-84, 85+
 This matches mortality_stats outputs for easy rate calculations.
 """
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pac
 from pathlib import Path
 
-def categorize_age(age_str):
-    """Map detailed age ranges to standard demographic groups."""
-    if pd.isna(age_str):
-        return "Unknown"
+# Standard age groups, and the upper bound of each group's starting age
+AGE_GROUP_ORDER = ['0-4', '5-14', '15-24', '25-34', '35-44', '45-54', '55-64', '65-74', '75-84', '85+']
+AGE_GROUP_BINS = [-1, 4, 14, 24, 34, 44, 54, 64, 74, 84, float('inf')]
+
+# Per-group populations fit in int32 and SEX is a 1/2 code
+HARMONIZED_DTYPES = {'YR': 'int16', 'SEX': 'int8', 'POP': 'int32'}
+
+
+def categorize_age(ages):
+    """Map a Series of detailed age ranges to standard demographic groups.
+
+    Ages are bucketed on their starting age (e.g. "01-04" -> 1, "25-29" -> 25),
+    so the whole column is mapped in pandas rather than row by row.
+    Missing or unparseable ages come back as NaN.
+    """
+    # Only a couple of dozen distinct age labels occur, so parse each once
+    # and map the results back onto the full column
+    unique_ages = pd.Series(ages.unique())
+    unique_groups = _categorize_unique_ages(unique_ages)
+    return ages.map(pd.Series(unique_groups.array, index=unique_ages))
+
+
+def _categorize_unique_ages(ages):
+    """Vectorized age-group mapping, applied to the distinct age labels."""
+    age_str = ages.astype("string").str.strip().str.replace('T', '', regex=False)
     
-    age_str = str(age_str).strip().replace('T', '')
+    # Extract starting age from range or single age
+    start_age = pd.to_numeric(age_str.str.extract(r'^(\d+)\s*(?:-.*)?$', expand=False), errors='coerce')
+    age_group = pd.cut(start_age, bins=AGE_GROUP_BINS, labels=AGE_GROUP_ORDER)
     
     # Handle special cases
-    if age_str == '<1' or age_str == '00' or age_str == '0':
-        return "0-4"
-    if age_str in ['85+', '80+', '90+']:
-        return "85+"
-    
-    # Extract starting age from range (e.g., "01-04" -> 1, "25-29" -> 25)
-    try:
-        if '-' in age_str:
-            start_age = int(age_str.split('-')[0])
-        else:
-            start_age = int(age_str)
-        
-        # Categorize based on starting age
-        if start_age <= 4:
-            return "0-4"
-        elif start_age <= 14:
-            return "5-14"
-        elif start_age <= 24:
-            return "15-24"
-        elif start_age <= 34:
-            return "25-34"
-        elif start_age <= 44:
-            return "35-44"
-        elif start_age <= 54:
-            return "45-54"
-        elif start_age <= 64:
-            return "55-64"
-        elif start_age <= 74:
-            return "65-74"
-        elif start_age <= 84:
-            return "75-84"
-        else:
-            return "85+"
-    except (ValueError, IndexError):
-        return "Unknown"
+    age_group = age_group.mask(age_str.isin(['<1', '00', '0']), '0-4')
+    age_group = age_group.mask(age_str.isin(['85+', '80+', '90+']), '85+')
+    return age_group
 
 def build_harmonized_population():
     """Load population data from CSV (1901-2000) and XLS (2001-2016) and aggregate to harmonized age groups."""
@@ -67,23 +61,23 @@ def build_harmonized_population():
     # Load 1901-2000 from CSV
     csv_path = Path('data_sources/population/development_code/downloaded_sourcefiles/combined_population_data.csv')
     df_csv = pd.read_csv(csv_path)
-    df_csv = df_csv[df_csv['YR'] <= 2000].copy()  # Keep only up to 2000
+    df_csv = df_csv[df_csv['YR'] <= 2000]  # Keep only up to 2000
     
     print(f"  Loaded {len(df_csv):,} CSV records (1901-2000)")
     
     # Apply age group mapping to CSV data
-    df_csv['age_group'] = df_csv['AGE'].apply(categorize_age)
+    # (kept as a separate Series so the filtered frame is never copied or mutated)
+    age_group = categorize_age(df_csv['AGE']).rename('age_group')
     
-    # Check for any "Unknown" mappings
-    unknown_count = (df_csv['age_group'] == 'Unknown').sum()
+    # Check for any unknown mappings
+    unknown_count = age_group.isna().sum()
     if unknown_count > 0:
         print(f"  ⚠️  {unknown_count} CSV records have unknown age mapping (will be excluded)")
     
-    # Remove unknown age mappings
-    df_csv_clean = df_csv[df_csv['age_group'] != 'Unknown'].copy()
-    
-    # Aggregate CSV data by year, sex, and age_group
-    harmonized_csv = df_csv_clean.groupby(['YR', 'SEX', 'age_group'])['POP'].sum().reset_index()
+    # Aggregate CSV data by year, sex, and age_group; groupby drops the
+    # unknown (NaN) age groups
+    harmonized_csv = df_csv['POP'].groupby([df_csv['YR'], df_csv['SEX'], age_group], observed=True).sum().reset_index()
+    harmonized_csv = harmonized_csv.astype(HARMONIZED_DTYPES)
     
     print("\n" + "="*80)
     print("Loading 2001-2016 data from XLS...")
@@ -91,28 +85,28 @@ def build_harmonized_population():
     
     # Load 2001-2016 from XLS
     xls_path = Path('data_sources/population/development_code/downloaded_sourcefiles/populations20012016.xls')
-    df_xls = pd.read_excel(xls_path, sheet_name='pops01-16')
+    df_xls = pd.read_excel(xls_path, sheet_name='pops01-16', engine='calamine')
     
     print(f"  Loaded {len(df_xls):,} XLS records (2001-2016)")
     
     # Apply age group mapping to XLS data (Agegroup is already in correct format)
-    df_xls['age_group'] = df_xls['Agegroup'].apply(categorize_age)
+    df_xls['age_group'] = categorize_age(df_xls['Agegroup'])
     
     # Aggregate XLS data by year, sex, and age_group
-    harmonized_xls = df_xls.groupby(['Year', 'Sex', 'age_group'])['Pops'].sum().reset_index()
+    harmonized_xls = df_xls.groupby(['Year', 'Sex', 'age_group'], observed=True)['Pops'].sum().reset_index()
     
     # Rename XLS columns to match CSV
     harmonized_xls = harmonized_xls.rename(columns={
         'Year': 'YR',
         'Sex': 'SEX',
         'Pops': 'POP'
-    })
+    }).astype(HARMONIZED_DTYPES)
     
     print("\n" + "="*80)
     print("Combining 1901-2000 and 2001-2016 data...")
     print("="*80)
     
-    # Combine both datasets
+    # Combine both datasets (matching dtypes, so concat does not upcast)
     harmonized = pd.concat([harmonized_csv, harmonized_xls], ignore_index=True)
     
     print(f"  Total records after combining: {len(harmonized):,}")
@@ -126,11 +120,10 @@ def build_harmonized_population():
     })
     
     # Map sex codes to labels
-    harmonized['sex'] = harmonized['sex'].map({1: 'Male', 2: 'Female'})
+    harmonized['sex'] = pd.Categorical(harmonized['sex'].map({1: 'Male', 2: 'Female'}), categories=['Female', 'Male'])
     
     # Order age groups logically
-    age_group_order = ['0-4', '5-14', '15-24', '25-34', '35-44', '45-54', '55-64', '65-74', '75-84', '85+']
-    harmonized['age_group'] = pd.Categorical(harmonized['age_group'], categories=age_group_order, ordered=True)
+    harmonized['age_group'] = pd.Categorical(harmonized['age_group'], categories=AGE_GROUP_ORDER, ordered=True)
     
     # Sort by year, sex, age_group
     harmonized = harmonized.sort_values(['year', 'sex', 'age_group']).reset_index(drop=True)
@@ -140,6 +133,21 @@ def build_harmonized_population():
     
     return harmonized
 
+def write_harmonized_csv(harmonized, output_path):
+    """Write the harmonized frame to CSV with Arrow's native CSV writer.
+
+    Output matches to_csv(index=False): nothing is quoted, which is safe
+    because no field in this table contains a comma or quote.
+    """
+    # Arrow would write the categoricals as dictionaries; write labels instead
+    table = pa.Table.from_pandas(
+        harmonized.assign(age_group=harmonized['age_group'].astype(str), sex=harmonized['sex'].astype(str)),
+        preserve_index=False,
+    )
+    with open(output_path, 'wb') as f:
+        f.write((','.join(harmonized.columns) + '\n').encode())
+        pac.write_csv(table, f, write_options=pac.WriteOptions(include_header=False, quoting_style='none'))
+
 def main():
     print("="*80)
     print("Building Harmonized UK Population Data (Age Groups)")
@@ -156,7 +164,12 @@ def main():
     # Save to population root folder
     output_path = Path('data_sources/population/uk_population_harmonized_age_groups.csv')
     print(f"\nSaving harmonized data to: {output_path}")
-    harmonized.to_csv(output_path, index=False)
+    write_harmonized_csv(harmonized, output_path)
+    
+    # Parquet copy keeps the categorical age_group/sex and int dtypes for consumers
+    parquet_path = output_path.with_suffix('.parquet')
+    print(f"Saving harmonized data to: {parquet_path}")
+    harmonized.to_parquet(parquet_path, compression='zstd', index=False)
     
     print(f"✅ Successfully created harmonized population file ({len(harmonized):,} records)")
     
@@ -171,10 +184,10 @@ def main():
     
     # Calculate totals by year (sample)
     print("\nTotal population by year (5-year intervals):")
-    totals = harmonized.groupby('year')['population'].sum()
-    for year in range(1901, 2017, 5):
-        if year in totals.index:
-            print(f"  {year}: {totals[year]:,}")
+    totals = harmonized.groupby('year', sort=False)['population'].sum()
+    sample_years = pd.RangeIndex(1901, 2017, 5).intersection(totals.index)
+    for year, total in totals.loc[sample_years].items():
+        print(f"  {year}: {total:,}")
     
     # Final summary
     print("\n" + "="*80)
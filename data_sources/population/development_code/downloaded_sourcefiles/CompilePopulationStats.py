@@ -1,29 +1,25 @@
 import pandas as pd
-import xlrd
 
 # Import data from popln_tcm77-215653.xls
+# (calamine is a Rust reader; much faster than xlrd for .xls)
 data_path = 'DataSources/popln_tcm77-215653.xls'
-xls = pd.ExcelFile(data_path)
-df = pd.read_excel(xls, 1)  # Adjust sheet name as necessary
-
-# remove blank columns
-df = df.dropna(axis=1, how='all')
+# Select columns and dtypes at read time rather than dropping blank columns after
+df = pd.read_excel(data_path, sheet_name=1, engine="calamine",  # Adjust sheet name as necessary
+                   usecols=['YR', 'SEX', 'AGE', 'POP'],
+                   dtype={'YR': 'int32', 'SEX': 'int8', 'POP': 'int64'})
 
 # show the first few rows to understand the structure
 print(df.head())
 
 # Import populations20012016.xls to df2
 data_path_2 = 'DataSources/populations20012016.xls'
-xls2 = pd.ExcelFile(data_path_2)
-df2 = pd.read_excel(xls2, 1)  # Adjust sheet name as necessary
-
-# remove blank columns again
-df2 = df2.dropna(axis=1, how='all')
+# usecols leaves out the Sort column (and any blank columns) at read time
+df2 = pd.read_excel(data_path_2, sheet_name=1, engine="calamine",  # Adjust sheet name as necessary
+                    usecols=['Year', 'Agegroup', 'Sex', 'Pops'],
+                    dtype={'Year': 'int32', 'Sex': 'int8', 'Pops': 'int64'})
 # show the first few rows to understand the structure
 print(df2.head())
 
-# drop sort column from DF2
-df2 = df2.drop(columns=['Sort'])
 # rename columns in df2 to match df year=yr, agegroup=age, sex=sex, pops=pop
 df2 = df2.rename(columns={'Year': 'YR', 'AgeGroup': 'AGE', 'Sex': 'SEX', 'Pops': 'POP'})
 # Append df and df2
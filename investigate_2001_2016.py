@@ -1,19 +1,28 @@
 import pandas as pd
 from pathlib import Path
 
-# Load source data
+# Load source data: only the columns used here, keeping just the 2001-2016
+# rows of each chunk so the full file is never held in memory
 csv_path = Path('data_sources/population/development_code/downloaded_sourcefiles/combined_population_data.csv')
-df = pd.read_csv(csv_path)
+reader = pd.read_csv(
+    csv_path,
+    usecols=['YR', 'SEX', 'AGE', 'POP'],
+    dtype={'YR': 'int32', 'SEX': 'int8', 'POP': 'int64'},
+    engine='c',
+    chunksize=1_000_000,
+)
 
 # Focus on 2001-2016 with NaN ages
-df_2001_2016 = df[(df['YR'] >= 2001) & (df['YR'] <= 2016)].copy()
+df_2001_2016 = pd.concat(
+    chunk[(chunk['YR'] >= 2001) & (chunk['YR'] <= 2016)] for chunk in reader
+)
 print(f"Total records 2001-2016: {len(df_2001_2016)}")
 print(f"Records with NaN age: {df_2001_2016['AGE'].isna().sum()}")
 print(f"Records with non-NaN age: {df_2001_2016['AGE'].notna().sum()}")
 
 print("\n" + "="*80)
 print("Examining 2001 data structure:")
-df_2001 = df[df['YR'] == 2001]
+df_2001 = df_2001_2016[df_2001_2016['YR'] == 2001]
 print(f"Total 2001 records: {len(df_2001)}")
 print(f"Unique SEX values: {sorted(df_2001['SEX'].unique())}")
 print(f"Unique AGE values: {sorted(df_2001['AGE'].dropna().unique())}")
@@ -36,7 +45,7 @@ print(totals_2001_2016.to_string())
 
 print("\n" + "="*80)
 print("Checking if NaN and non-NaN ages are for same years:")
-df_with_nan = df[(df['YR'] >= 2001) & (df['YR'] <= 2016) & (df['AGE'].isna())]
-df_without_nan = df[(df['YR'] >= 2001) & (df['YR'] <= 2016) & (df['AGE'].notna())]
+df_with_nan = df_2001_2016[df_2001_2016['AGE'].isna()]
+df_without_nan = df_2001_2016[df_2001_2016['AGE'].notna()]
 print(f"Years with NaN ages: {sorted(df_with_nan['YR'].unique())}")
 print(f"Years without NaN ages: {sorted(df_without_nan['YR'].unique())}")
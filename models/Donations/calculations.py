@@ -1,9 +1,8 @@
+from dataclasses import dataclass
+from functools import cached_property
 import pandas as pd
 import streamlit as st
 from sl_core.components.calculations import (
-    count_unique_records,
-    count_missing_values,
-    count_null_values,
     get_top_or_bottom_entity_by_column
     )
 from sl_core.components.filters import apply_filters
@@ -13,6 +12,7 @@ from sl_core.utils.logger import logger
 # Convert placeholder date to datetime once
 PLACEHOLDER_DATE = st.session_state.get("PLACEHOLDER_DATE")
 PLACEHOLDER_ID = st.session_state.get("PLACEHOLDER_ID")
+_PLACEHOLDER_DT = pd.Timestamp(PLACEHOLDER_DATE) if PLACEHOLDER_DATE else pd.NaT
 
 
 def count_donation_eventcout_values(df, column, filters=None):
@@ -21,35 +21,84 @@ def count_donation_eventcout_values(df, column, filters=None):
     return df[column]["EventCount"].sum()
 
 
+@dataclass
+class DonationSnapshot:
+    """Filtered donations plus the columns and masks the counts share.
+
+    Build one per render with DonationSnapshot.from_frame(df, filters) and
+    pass it to count_unique_donors / get_blank_* in place of df, so the
+    filters are applied once rather than once per count. Each column or mask
+    is worked out the first time a count asks for it.
+    """
+    filtered_df: pd.DataFrame
+
+    @classmethod
+    def from_frame(cls, df, filters=None):
+        return cls(filtered_df=apply_filters(df, filters))
+
+    @cached_property
+    def donor_ids_nonnull(self):
+        return self.filtered_df["DonorId"].dropna()
+
+    @cached_property
+    def received_date_nonplaceholder_mask(self):
+        return self.filtered_df["ReceivedDate"].ne(_PLACEHOLDER_DT)
+
+    @cached_property
+    def party_id_nonplaceholder_mask(self):
+        return self.filtered_df["PartyId"].ne(PLACEHOLDER_ID)
+
+    @cached_property
+    def donor_id_nonplaceholder_mask(self):
+        return self.filtered_df["DonorId"].ne(PLACEHOLDER_ID)
+
+
+def _as_snapshot(df, filters=None):
+    """Return df unchanged if it is already a snapshot, else build one."""
+    if isinstance(df, DonationSnapshot):
+        return df
+    return DonationSnapshot.from_frame(df, filters)
+
+
 # Specific functions using the generic ones
 def count_unique_donors(df, filters=None):
     """Counts unique donors based on a specific DonationType."""
-    return count_unique_records(df, "DonorId", filters)
+    return _as_snapshot(df, filters).donor_ids_nonnull.nunique()
+
+
+def count_unique_donors_of_type(df, donation_type, filters=None):
+    """Counts unique donors whose donations have the given DonationType."""
+    donations = _as_snapshot(df, filters).filtered_df
+    is_type = donations["DonationType"] == donation_type
+    return donations.loc[is_type, "DonorId"].nunique()
 
 
 def get_impermissible_donors_ct(df, filters=None):
-    return count_unique_donors(df, "Impermissible Donor", filters)
+    return count_unique_donors_of_type(df, "Impermissible Donor", filters)
 
 
 def get_unidentified_donors_ct(df, filters=None):
-    return count_unique_donors(df, "Unidentified Donor", filters)
+    return count_unique_donors_of_type(df, "Unidentified Donor", filters)
 
 
 def get_blank_received_date_ct(df, filters=None):
-    return count_missing_values(df, "ReceivedDate", PLACEHOLDER_DATE, filters)
+    snapshot = _as_snapshot(df, filters)
+    return int((~snapshot.received_date_nonplaceholder_mask).sum())
 
 
 def get_blank_regulated_entity_id_ct(df, filters=None):
-    return count_missing_values(df, "PartyId", PLACEHOLDER_ID,
-                                filters)
+    snapshot = _as_snapshot(df, filters)
+    return int((~snapshot.party_id_nonplaceholder_mask).sum())
 
 
 def get_blank_donor_id_ct(df, filters=None):
-    return count_missing_values(df, "DonorId", PLACEHOLDER_ID, filters)
+    snapshot = _as_snapshot(df, filters)
+    return int((~snapshot.donor_id_nonplaceholder_mask).sum())
 
 
 def get_blank_donor_name_ct(df, filters=None):
-    return count_null_values(df, "DonorName", filters)
+    snapshot = _as_snapshot(df, filters)
+    return snapshot.filtered_df["DonorName"].isna().sum()
 
 
 def get_dubious_donors(df, filters=None):
@@ -113,8 +162,9 @@ def get_regentity_ct(df, filters=None):
 def get_mindate(df, filters=None):
     """Earliest date from data subset"""
     df = apply_filters(df, filters)
-    df = df[df["ReceivedDate"] != pd.to_datetime(PLACEHOLDER_DATE)]
-    return df["ReceivedDate"].min()
+    # Mask the date column alone rather than copying the whole frame
+    dates = df["ReceivedDate"]
+    return dates[dates != _PLACEHOLDER_DT].min()
 
 
 def get_maxdate(df, filters=None):
@@ -133,20 +183,42 @@ def get_returned_donations_ct(df, filters=None):
 def get_returned_donations_value(df, filters=None):
     """Calculates the total value of all returned donations."""
     df = apply_filters(df, filters)
-    return df[df["DonationAction"] == "Returned"]["Value"].sum()
+    action = df["DonationAction"]
+    if isinstance(action.dtype, pd.CategoricalDtype):
+        # Compare the integer category codes rather than the labels;
+        # -1 is the code for NaN, so -2 matches nothing
+        categories = action.cat.categories
+        code = categories.get_loc("Returned") if "Returned" in categories else -2
+        mask = action.cat.codes.to_numpy() == code
+    else:
+        mask = (action == "Returned").to_numpy()
+    return df["Value"][mask].sum()
+
+
+def _data_date_range():
+    """(earliest non-placeholder, most recent) ReceivedDate of data_clean.
+
+    Worked out once per loaded frame and kept in session state beside it;
+    replacing data_clean with a new frame recomputes it.
+    """
+    df = st.session_state.get("data_clean", None)
+    cached = st.session_state.get("data_clean_date_range")
+    if cached is not None and cached[0] is df:
+        return cached[1]
+    dates = df["ReceivedDate"]
+    date_range = (dates[dates != _PLACEHOLDER_DT].min(), dates.max())
+    st.session_state["data_clean_date_range"] = (df, date_range)
+    return date_range
 
 
 def get_datamindate():
     """Earliest date from full data"""
-    df = st.session_state.get("data_clean", None)
-    df = df[df["ReceivedDate"] != pd.to_datetime(PLACEHOLDER_DATE)]
-    return df["ReceivedDate"].min()
+    return _data_date_range()[0]
 
 
 def get_datamaxdate():
     """Most recent date from full data"""
-    df = st.session_state.get("data_clean", None)
-    return df["ReceivedDate"].max()
+    return _data_date_range()[1]
 
 
 def get_donationtype_ct(df, filters=None):
@@ -158,7 +230,7 @@ def get_donationtype_ct(df, filters=None):
 def get_donationtype_value(df, filters=None):
     """Calculates the total value of all returned donations."""
     df = apply_filters(df, filters)
-    return df.groupby("DonationType")["Value"].sum()
+    return df.groupby("DonationType", observed=True)["Value"].sum()
 
 
 def get_donation_isanaggregate_ct(df, filters=None):
@@ -170,7 +242,7 @@ def get_donation_isanaggregate_ct(df, filters=None):
 def get_donation_isanaggregate_value(df, filters=None):
     """Calculates the total value of all aggregated donations."""
     df = apply_filters(df, filters)
-    return df.groupby("IsAnAggregate")["Value"].sum()
+    return df.groupby("IsAnAggregate", observed=True)["Value"].sum()
 
 
 def get_median_donation(df, filters=None):
@@ -182,37 +254,37 @@ def get_median_donation(df, filters=None):
 def get_avg_donations_per_entity(df, filters=None):
     """Calculates the average number of donations per entity."""
     df = apply_filters(df, filters)
-    return df.groupby("PartyId").size().mean()
+    return df.groupby("PartyId", observed=True, sort=False).size().mean()
 
 
 def get_avg_value_per_entity(df, filters=None):
     """Calculates the average value of donations per entity."""
     df = apply_filters(df, filters)
-    return df.groupby("PartyId")["Value"].mean().mean()
+    return df.groupby("PartyId", observed=True, sort=False)["Value"].mean().mean()
 
 
 def get_avg_donors_per_entity(df, filters=None):
     """Calculates the average number of donors per entity."""
     df = apply_filters(df, filters)
-    return df.groupby("PartyId")["DonorId"].nunique().mean()
+    return df.groupby("PartyId", observed=True, sort=False)["DonorId"].nunique().mean()
 
 
 def get_donors_stdev(df, filters=None):
     """Calculates the standard deviation of donors per entity."""
     df = apply_filters(df, filters)
-    return df.groupby("PartyId").size().std()
+    return df.groupby("PartyId", observed=True, sort=False).size().std()
 
 
 def get_value_stdev(df, filters=None):
     """Calculates the standard deviation of value per entity."""
     df = apply_filters(df, filters)
-    return df.groupby("PartyId")["Value"].mean().std()
+    return df.groupby("PartyId", observed=True, sort=False)["Value"].mean().std()
 
 
 def get_noofdonors_per_ent_stdev(df, filters=None):
     """Calculates the standard deviation of donors per entity."""
     df = apply_filters(df, filters)
-    return df.groupby("PartyId")["DonorId"].nunique().std()
+    return df.groupby("PartyId", observed=True, sort=False)["DonorId"].nunique().std()
 
 
 # Function to calculate key values
@@ -266,47 +338,48 @@ def compute_summary_statistics(df, filters):
             "most_valuable_donor": ("", 0.0),
         }
 
-    regentity_ct = get_regentity_ct(df, filters)
-    donors_ct = get_donors_ct(df, filters)
-    donations_ct = get_donations_ct(df, filters)
-    value_total = get_value_total(df, filters)
-    value_mean = get_value_mean(df, filters)
-    avg_donations_per_entity = get_avg_donations_per_entity(df, filters)
-    avg_value_per_entity = get_avg_value_per_entity(df, filters)
-    avg_donors_per_entity = get_avg_donors_per_entity(df, filters)
-    donors_stdev = get_donors_stdev(df, filters)
-    value_stdev = get_value_stdev(df, filters)
-    noofdonors_per_ent_stdev = get_noofdonors_per_ent_stdev(df, filters)
+    # df is already filtered; derive every per-entity statistic from a
+    # single PartyId groupby rather than re-filtering in each helper.
+    by_entity = df.groupby("PartyId", observed=True, sort=False)
+    entity_sizes = by_entity.size()
+    entity_value_mean = by_entity["Value"].mean()
+    entity_donor_ct = by_entity["DonorId"].nunique()
+
+    regentity_ct = df["PartyName"].nunique()
+    donors_ct = df["DonorId"].nunique()
+    donations_ct = df["EventCount"].sum()
+    value_total = df["Value"].sum()
+    value_mean = df["Value"].mean()
+    avg_donations_per_entity = entity_sizes.mean()
+    avg_value_per_entity = entity_value_mean.mean()
+    avg_donors_per_entity = entity_donor_ct.mean()
+    donors_stdev = entity_sizes.std()
+    value_stdev = entity_value_mean.std()
+    noofdonors_per_ent_stdev = entity_donor_ct.std()
     most_common_entity = get_top_or_bottom_entity_by_column(df=df,
                                                             column="PartyName",
                                                             value_column="EventCount",
-                                                            top=True,
-                                                            filters=filters)
+                                                            top=True)
     most_valuable_entity = get_top_or_bottom_entity_by_column(df=df,
                                                               column="PartyName",
                                                               value_column="Value",
-                                                              top=True,
-                                                              filters=filters)
+                                                              top=True)
     least_common_entity = get_top_or_bottom_entity_by_column(df=df,
                                                              column="PartyName",
                                                              value_column="EventCount",
-                                                             top=False,
-                                                             filters=filters)
+                                                             top=False)
     least_valuable_entity = get_top_or_bottom_entity_by_column(df=df,
                                                                column="PartyName",
                                                                value_column="Value",
-                                                               top=False,
-                                                               filters=filters)
+                                                               top=False)
     most_common_donor = get_top_or_bottom_entity_by_column(df=df,
                                                            column="DonorName",
                                                            value_column="EventCount",
-                                                           top=True,
-                                                           filters=filters)
+                                                           top=True)
     most_valuable_donor = get_top_or_bottom_entity_by_column(df=df,
                                                              column="DonorName",
                                                              value_column="Value",
-                                                             top=True,
-                                                             filters=filters)
+                                                             top=True)
     return {
         "unique_reg_entities": regentity_ct,
         "unique_donors": donors_ct,
@@ -1,5 +1,30 @@
+import logging
+from functools import lru_cache
+import numpy as np
+import pandas as pd
 from sl_core.utils.logger import logger
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the numpy path is used instead
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _range_index(totals, lows, highs):
+        """Index of the first (low, high) range holding each total, or -1."""
+        out = np.full(totals.size, -1, np.int64)
+        for i in range(totals.size):
+            t = totals[i]
+            for j in range(lows.size):
+                if lows[j] <= t <= highs[j]:
+                    out[i] = j
+                    break
+        return out
+else:
+    _range_index = None
+
 
 def determine_groups_optimized(df,
                                entity,
@@ -23,61 +48,75 @@ def determine_groups_optimized(df,
                              to calculate thresholds per group instead
                              of lifetime totals.
     Returns:
-        pd.Series: A Series containing assigned groups for each row.
+        pd.Series: A categorical Series containing assigned groups for
+        each row, aligned to df.index (not renumbered from 0), so it can be
+        assigned straight back as a column of df.
     """
     # Step 1: Compute total measure per entity (and optionally
     #   per groupby_column)
+    # Group on category codes rather than hashing the entity strings;
+    # observed=True skips categories that have no rows
+    entity_key = df[entity]
+    if pd.api.types.is_string_dtype(entity_key):
+        entity_key = entity_key.astype("category")
     if groupby_column and groupby_column in df.columns:
-        entity_totals = df.groupby([entity, groupby_column],
-                                   as_index=False)[measure].sum()
+        entity_totals = df[measure].groupby(
+            [entity_key, df[groupby_column]], observed=True
+        ).sum().reset_index()
         merge_columns = [entity, groupby_column]
     else:
-        entity_totals = df.groupby(entity, as_index=False)[measure].sum()
+        entity_totals = df[measure].groupby(
+            entity_key, observed=True).sum().reset_index()
         merge_columns = [entity]
     entity_totals.rename(columns={measure: "total_measure"}, inplace=True)
 
     # Step 2: Assign groups based on thresholds or (exceptions)
-    # if exception_dict is provided, use assign_group_with_exceptions
-    # other wise use assign_group
+    # entities in exception_dict keep their own name, as in
+    # assign_group_with_exceptions
+    entity_values = entity_totals[entity].to_numpy()
+    groups = assign_groups_vectorized(
+        entity_totals["total_measure"].to_numpy(),
+        thresholds_dict,
+        entity_values
+    )
     if exception_dict:
         # logger to show exception dict being used
         logger.debug(f"Group assignment with exceptions: {exception_dict}")
-        entity_totals["group"] = entity_totals.apply(
-            lambda row: assign_group_with_exceptions(
-                row,
-                thresholds_dict,
-                row[entity],
-                exception_dict
-            ), axis=1
-        )
+        is_exception = entity_totals[entity].isin(
+            frozenset(exception_dict)).to_numpy()
+        groups = np.where(is_exception, entity_values, groups)
+    entity_totals["group"] = groups
+
+    # Known labels: every threshold label (in threshold order) followed
+    # by the entity names that fell outside the thresholds or are exceptions
+    threshold_labels = list(dict.fromkeys(thresholds_dict.values()))
+    assigned = entity_totals["group"]
+    group_dtype = pd.CategoricalDtype(threshold_labels + list(
+        pd.unique(assigned[~assigned.isin(threshold_labels)].dropna())))
+    # categorical here too, so value_counts below counts codes
+    entity_totals["group"] = assigned.astype(group_dtype)
+
+    # Step 3: Look each row's group up by its merge key(s) rather than
+    # merging the totals back into a copy of the whole DataFrame
+    if len(merge_columns) == 1:
+        mapping = dict(zip(entity_totals[entity].to_numpy(),
+                           entity_totals["group"].to_numpy()))
+        groups = pd.Series(df[entity].to_numpy(), index=df.index,
+                           name="group").map(mapping).astype(group_dtype)
     else:
-        entity_totals["group"] = entity_totals.apply(
-            lambda row: assign_group(
-                row["total_measure"],
-                thresholds_dict,
-                row[entity]
-            ),
-            axis=1
-        )
-
-    # Step 3: Merge back into the original DataFrame
-    merge_cols = merge_columns + ["group"]
-    df = df.merge(entity_totals[merge_cols], on=merge_columns, how="left")
-    logger.debug(f"Group assignment: {df['group'].value_counts()}")
-    logger.debug(f"Group assignment: {entity_totals['group'].value_counts()}")
-
-    # Step 4: Validate row count consistency
-    if len(df) != len(df):
-        logger.error(f"Length mismatch: original {len(df)}, merged {len(df)}")
-        df.drop_duplicates(inplace=True)
-
-        if len(df) != len(df):
-            logger.critical(f"Mismatch after deduplication: original"
-                            f" {len(df)}, merged {len(df)}")
-            return None
-
-    # Step 5: Return the group column
-    return df["group"]
+        group_lookup = entity_totals.set_index(merge_columns)["group"]
+        row_keys = pd.MultiIndex.from_frame(df[merge_columns])
+        groups = pd.Series(group_lookup.reindex(row_keys).to_numpy(),
+                           index=df.index, name="group").astype(group_dtype)
+    # value_counts hashes the whole column, so only build it when the
+    # message will actually be emitted
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Group assignment: %s", groups.value_counts())
+        logger.debug("Group assignment: %s",
+                     entity_totals["group"].value_counts())
+
+    # Step 4: Return the group column
+    return groups
 
 
 def assign_group(total, thresholds_dict, entity_value):
@@ -91,6 +130,62 @@ def assign_group(total, thresholds_dict, entity_value):
     return entity_value  # Assign entity name if above max threshold
 
 
+@lru_cache(maxsize=8)
+def _compile_thresholds(threshold_items):
+    """
+    (lows, highs, labels, order, disjoint) arrays for thresholds_dict.items().
+    lows/highs/labels keep the dict's order, which decides the first match
+    when ranges overlap; order sorts them by low bound, and disjoint says
+    whether the sorted ranges are non-empty and strictly separated, so at
+    most one can hold any total.
+    Cached because the same thresholds are reused on every rerun.
+    """
+    lows = np.array([low for (low, _), _ in threshold_items], dtype=float)
+    highs = np.array([high for (_, high), _ in threshold_items], dtype=float)
+    labels = np.array([label for _, label in threshold_items], dtype=object)
+    order = np.argsort(lows, kind="stable")
+    disjoint = bool(np.all(lows <= highs)
+                    and np.all(lows[order][1:] > highs[order][:-1]))
+    for arr in (lows, highs, labels, order):
+        arr.flags.writeable = False
+    return lows, highs, labels, order, disjoint
+
+
+def assign_groups_vectorized(totals, thresholds_dict, entity_values):
+    """
+    Array version of assign_group for a whole column of totals.
+    Each total takes the label of the first range in thresholds_dict order
+    with low <= total <= high, as assign_group does; totals outside every
+    range take the matching entity value. Disjoint ranges are matched with
+    a single searchsorted over the sorted high bounds, overlapping ones
+    with a compiled first-match loop when numba is installed, otherwise
+    one mask per range.
+    """
+    entity_values = np.asarray(entity_values, dtype=object)
+    if not thresholds_dict:
+        return entity_values.copy()
+    lows, highs, labels, order, disjoint = _compile_thresholds(
+        tuple(thresholds_dict.items()))
+
+    totals = np.asarray(totals, dtype=float)
+    if disjoint:
+        sorted_lows, sorted_highs = lows[order], highs[order]
+        pos = np.searchsorted(sorted_highs, totals, side="left")
+        in_range = pos < len(order)
+        pos = np.minimum(pos, len(order) - 1)
+        in_range &= sorted_lows[pos] <= totals
+        idx = np.where(in_range, order[pos], -1)
+    elif _range_index is not None:
+        # compiled single pass over the totals
+        idx = _range_index(totals, lows, highs)
+    else:
+        # later ranges first, so earlier ones overwrite them
+        idx = np.full(totals.size, -1, np.int64)
+        for j in range(len(labels) - 1, -1, -1):
+            idx[(lows[j] <= totals) & (totals <= highs[j])] = j
+    return np.where(idx >= 0, labels[idx], entity_values)
+
+
 def assign_group_with_exceptions(row,
                                  thresholds_dict,
                                  entity_value,
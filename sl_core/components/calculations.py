@@ -37,7 +37,7 @@ def get_top_or_bottom_entity_by_column(df,
     Returns:
         tuple: (EntityName, Value)
     """
-    grouped = df.groupby(column)[value_column].sum()
+    grouped = df.groupby(column, observed=True)[value_column].sum()
     if top:
         entity = grouped.idxmax()
         value = grouped.max()
@@ -1,6 +1,7 @@
 import pandas as pd
 import re
 import pdpy
+from utils.name_cleaning import create_unified_name_columns, get_parties_from_pdpy_df
 
 
 
@@ -112,23 +113,6 @@ def create_unified_name_column(given_name, family_name):
     return First_Last_Name, Last_First_Name
 
 
-# Function to determine party based on name
-def get_party_from_pdpy_df(pdpydf, name):
-    if pdpydf is not None:
-        party = pdpydf.loc[pdpydf["First_Last_Name"] == name,
-                           "party_name"].values
-        if party.size > 0:
-            return party[0]
-        else:
-            party = pdpydf.loc[pdpydf["display_name"] == name,
-                               "party_name"].values
-            if party.size > 0:
-                return party[0]
-        return "Unknown"
-    else:
-        return "Issue with PdPy data"
-
-
 @log_function_call
 def clean_political_party_data():
     # Load MP party memberships data
@@ -143,16 +127,12 @@ def clean_political_party_data():
     # create pdpydf
     pdpydf = get_party_df_from_pdpy()
     # create unified name column on pdpydf
-    pdpydf[["First_Last_Name", "Last_First_Name"]] = pdpydf.apply(
-        lambda row: pd.Series(
-            create_unified_name_column(row["given_name"], row["family_name"])
-        ),
-        axis=1,
+    pdpydf["First_Last_Name"], pdpydf["Last_First_Name"] = (
+        create_unified_name_columns(pdpydf["given_name"], pdpydf["family_name"])
     )
     # Assign PoliticalParty based off PdpY data
-    df["PoliticalParty_pdpy"] = df.apply(
-        lambda row: get_party_from_pdpy_df(pdpydf, row["CleanedName"]),
-        axis=1,
+    df["PoliticalParty_pdpy"] = get_parties_from_pdpy_df(
+        pdpydf, df["CleanedName"]
     )
     logger.debug("sample of original file")
     logger.debug(
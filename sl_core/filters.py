@@ -1,14 +1,19 @@
 """Reusable data filtering utilities."""
 from typing import Any
+import numpy as np
 import pandas as pd
 
 
 def apply_filters(frame: pd.DataFrame, **filters: Any) -> pd.DataFrame:
-    """Apply simple equality filters to a DataFrame."""
-    result = frame.copy()
+    """Apply simple equality filters to a DataFrame.
+
+    The filters are combined into one boolean mask and the frame is sliced
+    once, so no intermediate frame is built per filter.
+    """
+    mask = np.ones(len(frame), dtype=bool)
     for column, value in filters.items():
         if value is None:
             continue
-        if column in result:
-            result = result[result[column] == value]
-    return result
+        if column in frame:
+            mask &= (frame[column] == value).to_numpy(dtype=bool, na_value=False)
+    return frame.loc[mask]
@@ -1,72 +1,75 @@
 import re
 
 
+# Honorifics and titles stripped from the front of donor names
+PREFIXES = (
+    "Mr",
+    "Mrs",
+    "Ms",
+    "Miss",
+    "Dr",
+    "Prof",
+    "Sir",
+    "Lord",
+    "Lady",
+    "Dame",
+    "Baroness",
+    "Baron",
+    "Viscount",
+    "Viscountess",
+    "Earl",
+    "Countess",
+    "Duke",
+    "Duchess",
+    "Prince",
+    "Princess",
+    "King",
+    "Queen",
+    "President",
+    "Chairman",
+    "The Rt Hon",
+)
+
+# Post-nominals stripped from the end of donor names (matched in any case)
+SUFFIXES = (
+    "MP",
+    "MSP",
+    "MEP",
+    "QC",
+    "CBE",
+    "OBE",
+    "MBE",
+    "KBE",
+    "DBE",
+)
+
+# One alternation per list, so each name is scanned twice rather than
+# once per prefix and suffix
+_PREFIX_RE = re.compile(r"\b(" + "|".join(re.escape(p) for p in PREFIXES) + r")\b")
+_SUFFIX_RE = re.compile(
+    r"\b(" + "|".join(re.escape(s) for s in SUFFIXES) + r")\b", re.IGNORECASE
+)
+
+
+def _extract(pattern, options, name):
+    """Remove every match of pattern from name; return the matched options
+    in list order (each once) with the remaining name."""
+    found = set(pattern.findall(name))
+    if not found:
+        return [], name
+    if pattern.flags & re.IGNORECASE:
+        # case-insensitive options are listed in upper case
+        found = {match.upper() for match in found}
+    return [o for o in options if o in found], pattern.sub("", name)
+
+
 # Function to extract status and clean names
 def extract_status_and_clean_name(name):
-    status_list = []
-    for prefix in [
-        "Mr",
-        "Mrs",
-        "Ms",
-        "Miss",
-        "Dr",
-        "Prof",
-        "Sir",
-        "Lord",
-        "Lady",
-        "Dame",
-        "Baroness",
-        "Baron",
-        "Viscount",
-        "Viscountess",
-        "Earl",
-        "Countess",
-        "Duke",
-        "Duchess",
-        "Prince",
-        "Princess",
-        "King",
-        "Queen",
-        "President",
-        "Chairman",
-        "The Rt Hon",
-    ]:
-        if re.search(rf"\b{re.escape(prefix)}\b", name):
-            status_list.append(prefix)
-            name = re.sub(rf"\b{re.escape(prefix)}\b", "", name).strip()
-
-    for suffix in [
-        "MP",
-        "MSP",
-        "MEP",
-        "Mp",
-        "Msp",
-        "Mep",
-        "mp",
-        "msp",
-        "mep",
-        "QC",
-        "Qc",
-        "qc",
-        "CBE",
-        "Cbe",
-        "cbe",
-        "OBE",
-        "Obe",
-        "obe",
-        "MBE",
-        "Mbe",
-        "mbe",
-        "KBE",
-        "Kbe",
-        "kbe",
-        "DBE",
-        "Dbe",
-        "dbe",
-    ]:
-        if re.search(rf"\b{suffix}\b", name):
-            status_list.append(suffix)
-            name = re.sub(rf"\b{suffix}\b", "", name).strip()
+    prefixes, name = _extract(_PREFIX_RE, PREFIXES, name)
+    suffixes, name = _extract(_SUFFIX_RE, SUFFIXES, name)
+    status_list = prefixes + suffixes
+    if status_list:
+        name = " ".join(name.split())
 
     status = " & ".join(status_list) if status_list else None
     return name, status
@@ -77,3 +80,33 @@ def create_unified_name_column(given_name, family_name):
     First_Last_Name = given_name + " " + family_name
     Last_First_Name = family_name + " " + given_name
     return First_Last_Name, Last_First_Name
+
+
+# column version of create_unified_name_column for whole Series at once
+def create_unified_name_columns(given_names, family_names):
+    First_Last_Name = given_names.str.cat(family_names, sep=" ")
+    Last_First_Name = family_names.str.cat(given_names, sep=" ")
+    return First_Last_Name, Last_First_Name
+
+
+def build_party_lookup(pdpydf):
+    """Build a name -> party_name dict from PdPy membership data.
+
+    First_Last_Name matches take precedence over display_name, and the first
+    row wins for a repeated name, as with a scan of the DataFrame. Missing
+    names are left out, since they never compare equal in a scan.
+    """
+    lookup = {}
+    for column in ("display_name", "First_Last_Name"):
+        first_rows = pdpydf.dropna(subset=[column]).drop_duplicates(subset=column)
+        lookup.update(zip(first_rows[column], first_rows["party_name"]))
+    return lookup
+
+
+# Series version of party_membership.get_party_from_pdpy_df: builds the
+# lookup once for all names instead of scanning pdpydf for each one
+def get_parties_from_pdpy_df(pdpydf, names):
+    if pdpydf is None:
+        return names.map(lambda _name: "Issue with PdPy data")
+    lookup = build_party_lookup(pdpydf)
+    return names.map(lambda name: lookup.get(name, "Unknown"))
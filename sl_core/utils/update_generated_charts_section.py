@@ -9,7 +9,7 @@ DEFAULT_BASE_URL = "https://golder-development.github.io/UK_Socio_Economic_Model
 DEFAULT_CHARTS_DIR = "generated_charts"
 DEFAULT_INDEX_MD = "index.md"
 
-ALLOWED_EXTS = {".html", ".htm", ".png", ".jpg", ".jpeg", ".svg"}
+ALLOWED_EXTS = frozenset({".html", ".htm", ".png", ".jpg", ".jpeg", ".svg"})
 
 # Special-case display names for known files
 SPECIAL_NAMES = {
@@ -48,12 +48,16 @@ def to_display_name(filename: str) -> str:
 
 def build_content(base_url: str, charts_dir: Path) -> str:
     entries_by_cat = {}
-    for fname in sorted(os.listdir(charts_dir)):
-        if fname.startswith("."):
-            continue
-        ext = Path(fname).suffix.lower()
-        if ext not in ALLOWED_EXTS:
-            continue
+    # Filter while scanning so only publishable files reach the sort
+    with os.scandir(charts_dir) as it:
+        fnames = [
+            e.name
+            for e in it
+            if not e.name.startswith(".")
+            and Path(e.name).suffix.lower() in ALLOWED_EXTS
+        ]
+    fnames.sort()
+    for fname in fnames:
         cat = categorize(fname)
         url = base_url.rstrip("/") + "/" + charts_dir.name + "/" + fname
         label = to_display_name(fname)
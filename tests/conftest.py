@@ -0,0 +1,37 @@
+"""Shared pytest setup.
+
+The app modules import sl_core's packages both as ``sl_core.*`` and, from
+inside sl_core, as top-level ``utils``/``components``, so both the repository
+root and sl_core go on sys.path. sl_core's logger opens logs/app_log.log
+relative to the working directory at import time, so modules that pull it in
+are imported from a scratch directory that has a logs/ folder.
+"""
+import importlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+for path in (ROOT / "sl_core", ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+
+@pytest.fixture(scope="session")
+def import_app_module(tmp_path_factory):
+    """Import a module that depends on streamlit and sl_core's logger."""
+    pytest.importorskip("streamlit")
+    workdir = tmp_path_factory.mktemp("app")
+    (workdir / "logs").mkdir()
+
+    def _import(name):
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            return importlib.import_module(name)
+        finally:
+            os.chdir(cwd)
+
+    return _import
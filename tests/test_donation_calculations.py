@@ -0,0 +1,110 @@
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def calculations(import_app_module, monkeypatch):
+    module = import_app_module("models.Donations.calculations")
+    monkeypatch.setitem(
+        module.st.session_state,
+        "filter_def",
+        {"DubiousDonor_ftr": {"DonationType": ["Impermissible Donor", "Unidentified Donor"]}},
+    )
+    return module
+
+
+@pytest.fixture
+def donations():
+    return pd.DataFrame(
+        {
+            "DonationType": [
+                "Cash", "Impermissible Donor", "Unidentified Donor",
+                "Cash", "Impermissible Donor",
+            ],
+            "EventCount": [1, 2, 1, 1, 3],
+            "Value": [100.0, 250.5, 75.0, 20.0, 10.0],
+        }
+    )
+
+
+def _baseline(calculations, df, column):
+    filters = calculations.st.session_state["filter_def"].get("DubiousDonor_ftr")
+    return calculations.apply_filters(df, filters)[column].sum()
+
+
+@pytest.mark.parametrize(
+    "func, column",
+    [
+        ("get_dubious_donors_ct", "EventCount"),
+        ("get_dubious_donation_actions", "EventCount"),
+        ("get_dubious_donors_value", "Value"),
+        ("get_dubious_donation_value", "Value"),
+    ],
+)
+def test_dubious_totals_match_filter_and_sum(calculations, donations, func, column):
+    expected = _baseline(calculations, donations, column)
+
+    assert getattr(calculations, func)(donations) == expected
+
+
+def test_dubious_totals_are_not_shared_between_frames(calculations, donations):
+    other = donations.assign(Value=donations["Value"] * 2)
+
+    first = calculations.get_dubious_donors_value(donations)
+    second = calculations.get_dubious_donors_value(other)
+
+    assert second == pytest.approx(2 * first)
+
+
+def test_data_date_range_follows_data_clean(calculations, monkeypatch):
+    dates = pd.to_datetime(["2001-01-01", "2010-06-30", "2020-12-31"])
+    first = pd.DataFrame({"ReceivedDate": dates})
+    monkeypatch.setitem(calculations.st.session_state, "data_clean", first)
+
+    assert calculations.get_datamindate() == first["ReceivedDate"].min()
+    assert calculations.get_datamaxdate() == first["ReceivedDate"].max()
+
+    second = pd.DataFrame({"ReceivedDate": dates + pd.Timedelta(days=1)})
+    monkeypatch.setitem(calculations.st.session_state, "data_clean", second)
+
+    assert calculations.get_datamindate() == second["ReceivedDate"].min()
+    assert calculations.get_datamaxdate() == second["ReceivedDate"].max()
+
+
+@pytest.fixture
+def donors(donations):
+    return donations.assign(
+        DonorId=["D1", "D2", None, "D1", "D3"],
+        DonorName=["A", "B", None, "A", "C"],
+        PartyId=["P1", "P1", "P2", "P2", "P1"],
+        ReceivedDate=pd.to_datetime(["2020-01-01", "2020-02-01", None, "2020-03-01", "2020-04-01"]),
+    )
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        "count_unique_donors",
+        "get_blank_received_date_ct",
+        "get_blank_regulated_entity_id_ct",
+        "get_blank_donor_id_ct",
+        "get_blank_donor_name_ct",
+    ],
+)
+def test_counts_match_on_frame_and_snapshot(calculations, donors, func):
+    snapshot = calculations.DonationSnapshot.from_frame(donors)
+
+    assert getattr(calculations, func)(snapshot) == getattr(calculations, func)(donors)
+
+
+def test_snapshot_masks_are_built_on_first_use(calculations, donors):
+    snapshot = calculations.DonationSnapshot.from_frame(donors)
+    calculations.get_blank_donor_id_ct(snapshot)
+
+    assert "donor_id_nonplaceholder_mask" in vars(snapshot)
+    assert "received_date_nonplaceholder_mask" not in vars(snapshot)
+
+
+def test_unique_donors_by_donation_type(calculations, donors):
+    assert calculations.get_impermissible_donors_ct(donors) == 2
+    assert calculations.get_unidentified_donors_ct(donors) == 0
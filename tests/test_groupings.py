@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+THRESHOLDS = {
+    "contiguous": {(0, 500): "Small", (500.01, 5000): "Medium", (5000.01, 50000): "Large"},
+    "unordered": {(5000.01, 50000): "Large", (0, 500): "Small", (500.01, 5000): "Medium"},
+    "overlapping": {(0, 1000): "Low", (500, 5000): "Mid", (0, 100): "Tiny", (4000, 9000): "High"},
+    "touching": {(500, 1000): "Upper", (0, 500): "Lower"},
+    "empty_range": {(10, 1): "Never", (0, 100): "Some"},
+}
+
+
+@pytest.fixture
+def groupings(import_app_module):
+    return import_app_module("models.Donations.groupings")
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def kernel(request, groupings, monkeypatch):
+    if request.param == "numba":
+        if groupings._range_index is None:
+            pytest.skip("numba not installed")
+    else:
+        monkeypatch.setattr(groupings, "_range_index", None)
+    return request.param
+
+
+def _baseline_groups(df, entity, measure, thresholds, exceptions=None, groupby_column=None):
+    """determine_groups_optimized as it was before vectorisation."""
+    from models.Donations.groupings import assign_group, assign_group_with_exceptions
+
+    keys = [entity, groupby_column] if groupby_column else [entity]
+    totals = df.groupby(keys, as_index=False)[measure].sum()
+    totals = totals.rename(columns={measure: "total_measure"})
+    totals["group"] = totals.apply(
+        lambda row: assign_group_with_exceptions(row, thresholds, row[entity], exceptions)
+        if exceptions else assign_group(row["total_measure"], thresholds, row[entity]),
+        axis=1,
+    )
+    return df.merge(totals[keys + ["group"]], on=keys, how="left")["group"]
+
+
+@pytest.mark.parametrize("name", sorted(THRESHOLDS))
+def test_vectorized_matches_assign_group(groupings, kernel, name):
+    thresholds = THRESHOLDS[name]
+    totals = np.array([-5, 0, 50, 100, 100.5, 499.99, 500, 500.005, 500.01, 999,
+                       1000, 4500, 5000, 5000.01, 8000, 50000, 60000, np.nan])
+    entities = np.array([f"E{i}" for i in range(totals.size)], dtype=object)
+
+    expected = [groupings.assign_group(t, thresholds, e) for t, e in zip(totals, entities)]
+    result = groupings.assign_groups_vectorized(totals, thresholds, entities)
+
+    assert result.tolist() == expected
+
+
+@pytest.fixture
+def donations():
+    rng = np.random.default_rng(0)
+    parties = np.array(["Labour", "Conservative", "Green", "Reform", "SNP", "Plaid"])
+    return pd.DataFrame(
+        {
+            "PartyName": rng.choice(parties, 200),
+            "Sitting": rng.choice(["57th", "58th"], 200),
+            "Value": rng.gamma(1.0, 800.0, 200).round(2),
+        },
+        index=pd.RangeIndex(1000, 1200),
+    )
+
+
+@pytest.mark.parametrize("name", sorted(THRESHOLDS))
+@pytest.mark.parametrize("groupby_column", [None, "Sitting"])
+@pytest.mark.parametrize("exceptions", [None, {"Green": "Green"}])
+def test_determine_groups_matches_baseline(groupings, kernel, donations, name, groupby_column, exceptions):
+    thresholds = THRESHOLDS[name]
+    expected = _baseline_groups(donations, "PartyName", "Value", thresholds, exceptions, groupby_column)
+    result = groupings.determine_groups_optimized(
+        donations, "PartyName", "Value", thresholds, exceptions, groupby_column)
+
+    assert result.index.equals(donations.index)
+    assert result.astype(object).tolist() == expected.tolist()
@@ -0,0 +1,142 @@
+import importlib.util
+import random
+import sys
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+import pytest
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "visuals" / "political_mind_map.py"
+
+WXR_HEAD = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:excerpt="http://wordpress.org/export/1.2/excerpt/"
+  xmlns:content="http://purl.org/rss/1.0/modules/content/"
+  xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:wp="http://wordpress.org/export/1.2/">
+<channel><title>Blog</title>"""
+
+WXR_ITEM = """<item><title>{title}</title><link>https://blog.example.com/2020/01/0{i}/post-{i}/</link>
+<category domain="category" nicename="c"><![CDATA[{category}]]></category>
+<category domain="post_tag" nicename="t"><![CDATA[tag{i}]]></category>
+<category domain="post_tag" nicename="t"><![CDATA[shared]]></category>
+<content:encoded><![CDATA[<p>See <a href="https://blog.example.com/2020/01/01/post-1/">one</a></p>]]></content:encoded>
+<excerpt:encoded><![CDATA[]]></excerpt:encoded>
+<wp:post_id>{i}</wp:post_id><wp:post_date>2020-01-0{i} 10:00:00</wp:post_date>
+<wp:post_name>post-{i}</wp:post_name><wp:status>publish</wp:status>
+<wp:post_type>{post_type}</wp:post_type></item>"""
+
+
+def _wxr(items, doctype=""):
+    head = WXR_HEAD.replace("<rss", doctype + "<rss", 1) if doctype else WXR_HEAD
+    return (head + "".join(items) + "</channel></rss>").encode("utf-8")
+
+
+SAMPLE = _wxr(
+    [
+        WXR_ITEM.format(i=1, title="Schools &amp; é", category="Politics", post_type="post"),
+        WXR_ITEM.format(i=2, title="Markets", category="Politics", post_type="post"),
+        WXR_ITEM.format(i=3, title="About", category="Politics", post_type="page"),
+        WXR_ITEM.format(i=4, title="Holiday", category="Travel", post_type="post"),
+        WXR_ITEM.format(i=5, title="ECHR", category="Politics", post_type="post"),
+    ]
+)
+
+
+def _load(name, monkeypatch=None, block=()):
+    if monkeypatch is not None:
+        for module in block:
+            monkeypatch.setitem(sys.modules, module, None)
+    spec = importlib.util.spec_from_file_location(name, MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def mind_map():
+    return _load("political_mind_map")
+
+
+def test_lxml_and_elementtree_parse_the_same_posts(monkeypatch):
+    pytest.importorskip("lxml")
+    with_lxml = _load("political_mind_map_lxml")
+    with_et = _load("political_mind_map_et", monkeypatch, block=("lxml", "lxml.etree"))
+
+    assert with_lxml.ET.__name__ == "lxml.etree"
+    assert with_et.ET.__name__ == "xml.etree.ElementTree"
+    posts = with_lxml.parse_posts(SAMPLE)
+    assert posts == with_et.parse_posts(SAMPLE)
+    assert [p["post_id"] for p in posts] == [1, 2, 5]
+    assert posts[0]["title"] == "Schools & é"
+
+
+def test_external_entities_are_not_resolved(mind_map, tmp_path):
+    secret = tmp_path / "secret.txt"
+    secret.write_text("TOP-SECRET")
+    doctype = f'<!DOCTYPE rss [<!ENTITY xxe SYSTEM "{secret.as_uri()}">]>\n'
+    xml = _wxr([WXR_ITEM.format(i=1, title="&xxe;", category="Politics", post_type="post")], doctype)
+
+    try:
+        posts = mind_map.parse_posts(xml)
+    except Exception:  # refusing the document is also safe
+        return
+    assert "TOP-SECRET" not in repr(posts)
+
+
+def _baseline_layout(g):
+    """_layout as it was before the optional layout backend."""
+    pos = nx.spring_layout(g, k=0.6, iterations=200, seed=42, weight="weight")
+    xs = np.array([pos[n][0] for n in g.nodes()])
+    ys = np.array([pos[n][1] for n in g.nodes()])
+    xs = (xs - xs.mean()) / (xs.std() if xs.std() else 1.0)
+    ys = (ys - ys.mean()) / (ys.std() if ys.std() else 1.0)
+    return {n: (float(xs[i]), float(ys[i])) for i, n in enumerate(g.nodes())}
+
+
+@pytest.fixture(scope="module")
+def graph(mind_map):
+    g = nx.gnm_random_graph(60, 150, seed=3)
+    nx.set_edge_attributes(g, {e: 1.0 + (sum(e) % 4) for e in g.edges()}, "weight")
+    g.add_node(99)  # an isolated post
+    return g
+
+
+def test_layout_falls_back_to_spring_layout(monkeypatch, graph):
+    without_igraph = _load("political_mind_map_nx", monkeypatch, block=("igraph",))
+
+    assert without_igraph.ig is None
+    pos = without_igraph._layout(graph)
+    expected = _baseline_layout(graph)
+    assert list(pos) == list(expected)
+    np.testing.assert_allclose([pos[n] for n in graph], [expected[n] for n in graph])
+
+
+def test_igraph_layout_is_deterministic_and_normalised(mind_map, graph):
+    pytest.importorskip("igraph")
+    assert mind_map.ig is not None
+
+    pos = mind_map._layout(graph)
+    xy = np.array([pos[n] for n in graph.nodes()])
+
+    assert list(pos) == list(graph.nodes())
+    assert pos == mind_map._layout(graph)
+    assert xy.mean(axis=0) == pytest.approx([0.0, 0.0], abs=1e-9)
+    assert xy.std(axis=0) == pytest.approx([1.0, 1.0])
+
+
+def test_igraph_layout_restores_the_random_module_state(mind_map, graph):
+    pytest.importorskip("igraph")
+
+    random.seed(123)
+    expected = random.random()
+    random.seed(123)
+    mind_map._layout(graph)
+
+    assert random.random() == expected
+
+
+def test_layout_handles_empty_and_single_node_graphs(mind_map):
+    g = nx.Graph()
+    assert mind_map._layout(g) == {}
+    g.add_node(7)
+    assert mind_map._layout(g) == {7: (0.0, 0.0)}
@@ -1,11 +1,16 @@
 import pandas as pd
 
-df = pd.read_csv('data_sources/population/uk_population_harmonized_age_groups.csv')
+# Categorical labels and narrow ints at parse time; unique labels are then
+# just the categories
+df = pd.read_csv('data_sources/population/uk_population_harmonized_age_groups.csv',
+                 dtype={'year': 'int16', 'sex': 'category',
+                        'age_group': 'category', 'population': 'int32'})
 print('Shape:', df.shape)
 print('\nFirst 20 rows:')
 print(df.head(20))
 print('\nYears:', df['year'].min(), '-', df['year'].max())
-print('Age groups:', sorted(df['age_group'].unique()))
-print('Sex:', sorted(df['sex'].unique()))
-print('\nTotal population 1901:', df[df['year'] == 1901]['population'].sum())
-print('Total population 2000:', df[df['year'] == 2000]['population'].sum())
+print('Age groups:', df['age_group'].cat.categories.sort_values().tolist())
+print('Sex:', df['sex'].cat.categories.sort_values().tolist())
+totals = df.groupby('year', sort=False)['population'].sum()
+print('\nTotal population 1901:', totals.loc[1901])
+print('Total population 2000:', totals.loc[2000])
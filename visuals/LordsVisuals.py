@@ -1,7 +1,6 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 from pathlib import Path
-import glob
 
 # --------------------------------------------------
 # Configuration
@@ -45,11 +44,10 @@ df = df[df["year"] >= START_YEAR].copy()
 # Construct series
 # --------------------------------------------------
 
-df["Hereditary (all recorded)"] = (
-    df["Hereditary"].fillna(0)
-    + df["Excepted Hereditary"].fillna(0)
-    + df["Hereditary of 1st creation"].fillna(0)
-)
+# Row-wise sum skips NaN, so missing counts add as 0 without fillna copies
+df["Hereditary (all recorded)"] = df[
+    ["Hereditary", "Excepted Hereditary", "Hereditary of 1st creation"]
+].sum(axis=1)
 
 series_map = {
     "Life Peers": df["Life Peer"],
@@ -73,10 +71,11 @@ for label, series in series_map.items():
     )
 
 # Vertical reform markers
-y_max = max(df["total"]) * 1.05
+y_max = df["total"].max() * 1.05
+year_min, year_max = df["year"].min(), df["year"].max()
 
 for year, label in KEY_DATES.items():
-    if df["year"].min() <= year <= df["year"].max():
+    if year_min <= year <= year_max:
         plt.axvline(year, linestyle="--", linewidth=1)
         plt.text(
             year + 0.2,
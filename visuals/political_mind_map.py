@@ -18,20 +18,54 @@ import datetime as dt
 import io
 import json
 import math
+import random
 import re
 import sys
 import urllib.parse
 import zipfile
-import xml.etree.ElementTree as ET
 from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 import networkx as nx
 import numpy as np
 
+try:  # sparse product for tag similarity; posting lists are used without it
+    from scipy import sparse
+except ImportError:
+    sparse = None
 
-URL_RE = re.compile(r'https?://[^\s"<>]+')
+try:  # igraph's C Fruchterman-Reingold; NetworkX's spring_layout without it
+    import igraph as ig
+except ImportError:
+    ig = None
+
+try:  # orjson serialises the HTML payload several times faster than json
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # lxml parses large exports much faster; same Element API for our use
+    from lxml import etree as ET
+
+    # Exports are user-supplied: leave entities unexpanded and never fetch
+    # external resources (no XXE); lxml's default size limits stay on.
+    _ITERPARSE_KWARGS: Dict[str, Any] = {"resolve_entities": False, "no_network": True}
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+    _ITERPARSE_KWARGS = {}
+
+
+try:  # re2 scans long post bodies in linear time; same API for this pattern
+    import re2 as _url_re
+except ImportError:
+    _url_re = re
+
+URL_RE = _url_re.compile(r'https?://[^\s"<>]+')
+# netloc and path of an absolute URL, split where urlparse splits them
+URL_PARTS_RE = re.compile(r"https?://([^/?#]*)([^?#]*)")
 
 
 def _read_xml_bytes(path: Path) -> bytes:
@@ -44,67 +78,77 @@ def _read_xml_bytes(path: Path) -> bytes:
     return path.read_bytes()
 
 
-def _get_namespaces(xml_bytes: bytes) -> Dict[str, str]:
-    namespaces: Dict[str, str] = {}
-    for event, elem in ET.iterparse(io.BytesIO(xml_bytes), events=("start-ns",)):
-        prefix, uri = elem
-        namespaces[prefix] = uri
-    return namespaces
-
-
 def _get_text(elem: ET.Element, path: str, ns: Dict[str, str]) -> Optional[str]:
     found = elem.find(path, ns)
     return found.text if found is not None else None
 
 
-def parse_posts(xml_bytes: bytes) -> List[Dict[str, Any]]:
-    namespaces = _get_namespaces(xml_bytes)
-    tree = ET.parse(io.BytesIO(xml_bytes))
-    root = tree.getroot()
-    channel = root.find("channel")
-    if channel is None:
-        raise ValueError("Invalid WXR: missing <channel>")
-
-    wp_ns = {
-        "wp": namespaces.get("wp", ""),
-        "content": namespaces.get("content", ""),
-        "dc": namespaces.get("dc", ""),
-        "excerpt": namespaces.get("excerpt", ""),
+def _parse_item(it: ET.Element, wp_ns: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    post_type = _get_text(it, "wp:post_type", wp_ns)
+    if post_type != "post":
+        return None
+
+    post_id = _get_text(it, "wp:post_id", wp_ns)
+    slug = _get_text(it, "wp:post_name", wp_ns)
+
+    cats: List[str] = []
+    tags: List[str] = []
+    for c in it.findall("category"):
+        domain = c.attrib.get("domain")
+        text = c.text or ""
+        if domain == "category":
+            cats.append(text)
+        elif domain == "post_tag":
+            tags.append(text)
+
+    return {
+        "post_id": int(post_id) if post_id else None,
+        "title": _get_text(it, "title", {}),
+        "link": _get_text(it, "link", {}),
+        "slug": slug,
+        "status": _get_text(it, "wp:status", wp_ns),
+        "post_date": _get_text(it, "wp:post_date", wp_ns),
+        "categories": cats,
+        "tags": tags,
+        "content": _get_text(it, "content:encoded", wp_ns) or "",
+        "excerpt": _get_text(it, "excerpt:encoded", wp_ns) or "",
     }
 
-    posts: List[Dict[str, Any]] = []
-    for it in channel.findall("item"):
-        post_type = _get_text(it, "wp:post_type", wp_ns)
-        if post_type != "post":
-            continue
 
-        post_id = _get_text(it, "wp:post_id", wp_ns)
-        slug = _get_text(it, "wp:post_name", wp_ns)
-
-        cats: List[str] = []
-        tags: List[str] = []
-        for c in it.findall("category"):
-            domain = c.attrib.get("domain")
-            text = c.text or ""
-            if domain == "category":
-                cats.append(text)
-            elif domain == "post_tag":
-                tags.append(text)
-
-        posts.append(
-            {
-                "post_id": int(post_id) if post_id else None,
-                "title": _get_text(it, "title", {}),
-                "link": _get_text(it, "link", {}),
-                "slug": slug,
-                "status": _get_text(it, "wp:status", wp_ns),
-                "post_date": _get_text(it, "wp:post_date", wp_ns),
-                "categories": cats,
-                "tags": tags,
-                "content": _get_text(it, "content:encoded", wp_ns) or "",
-                "excerpt": _get_text(it, "excerpt:encoded", wp_ns) or "",
+def parse_posts(xml_bytes: bytes) -> List[Dict[str, Any]]:
+    # One streaming pass: namespace declarations arrive as start-ns events
+    # before the items that use them, and each <item> is cleared once read,
+    # so the whole document tree is never held in memory.
+    namespaces: Dict[str, str] = {}
+    wp_ns: Dict[str, str] = {}
+    has_channel = False
+
+    posts: List[Dict[str, Any]] = []
+    stream = io.BytesIO(xml_bytes)
+    for event, elem in ET.iterparse(stream, events=("start-ns", "end"), **_ITERPARSE_KWARGS):
+        if event == "start-ns":
+            prefix, uri = elem
+            namespaces[prefix] = uri
+            wp_ns = {
+                "wp": namespaces.get("wp", ""),
+                "content": namespaces.get("content", ""),
+                "dc": namespaces.get("dc", ""),
+                "excerpt": namespaces.get("excerpt", ""),
             }
-        )
+        elif elem.tag == "item":
+            post = _parse_item(elem, wp_ns)
+            if post is not None:
+                posts.append(post)
+            elem.clear()
+            # lxml can also drop the cleared items still attached to <channel>
+            if hasattr(elem, "getprevious"):
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        elif elem.tag == "channel":
+            has_channel = True
+
+    if not has_channel:
+        raise ValueError("Invalid WXR: missing <channel>")
 
     # Keep just Politics category posts if present
     politics_posts = [p for p in posts if "Politics" in (p.get("categories") or [])]
@@ -125,24 +169,81 @@ def _build_internal_link_edges(posts: List[Dict[str, Any]]) -> Set[Tuple[int, in
             path_to_id[path] = p["post_id"]
             path_to_id[path.split("/")[-1]] = p["post_id"]
 
+    # The same URLs recur across posts, so each distinct one is resolved once
+    @lru_cache(maxsize=4096)
+    def resolve(url: str) -> Optional[int]:
+        u = url.rstrip(').,;\'"!?')
+        netloc, path = URL_PARTS_RE.match(u).groups()
+        if "wordpress.com" not in netloc:
+            return None
+        if ";" in path:
+            # urlparse drops ;params from the last path segment
+            cut = path.find(";", path.rfind("/"))
+            if cut >= 0:
+                path = path[:cut]
+        path = path.strip("/")
+        return link_to_id.get(u) or path_to_id.get(path) or path_to_id.get(path.split("/")[-1])
+
     edges: Set[Tuple[int, int]] = set()
     for p in posts:
         src = p.get("post_id")
         if not src:
             continue
-        urls = URL_RE.findall(p.get("content") or "")
-        for u in urls:
-            u = u.rstrip(').,;\'"!?')
-            parsed = urllib.parse.urlparse(u)
-            if "wordpress.com" not in parsed.netloc:
-                continue
-            path = parsed.path.strip("/")
-            tgt = link_to_id.get(u) or path_to_id.get(path) or path_to_id.get(path.split("/")[-1])
+        for m in URL_RE.finditer(p.get("content") or ""):
+            tgt = resolve(m.group(0))
             if tgt and tgt != src:
                 edges.add((src, tgt))
     return edges
 
 
+def _shared_tag_weights_sparse(
+    post_tags: List[FrozenSet[str]], idf: Dict[str, float]
+) -> List[Tuple[int, int, float]]:
+    """(i, j, summed IDF of shared tags) for post pairs i < j, in (i, j) order.
+
+    With X the post x tag incidence matrix, (X * idf) @ X.T holds every
+    pair's shared-tag weight; only pairs that co-occur on a tag are nonzero.
+    """
+    tag_index: Dict[str, int] = {}
+    for tags in post_tags:
+        for t in tags:
+            tag_index.setdefault(t, len(tag_index))
+    rows = [i for i, tags in enumerate(post_tags) for _ in tags]
+    cols = [tag_index[t] for tags in post_tags for t in tags]
+    incidence = sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(len(post_tags), len(tag_index))
+    )
+    tag_idf = np.array([idf[t] for t in tag_index])
+    shared = sparse.triu(
+        sparse.csr_matrix(incidence.multiply(tag_idf)) @ incidence.T, k=1
+    ).tocsr()
+    shared.sort_indices()
+    shared = shared.tocoo()
+    return list(zip(shared.row.tolist(), shared.col.tolist(), shared.data.tolist()))
+
+
+def _shared_tag_weights_postings(
+    post_tags: List[FrozenSet[str]], idf: Dict[str, float]
+) -> List[Tuple[int, int, float]]:
+    """Same result as _shared_tag_weights_sparse without scipy.
+
+    Walks an inverted tag -> posts index, so only pairs that actually share
+    a tag are visited.
+    """
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for i, tags in enumerate(post_tags):
+        for t in tags:
+            postings[t].append(i)
+
+    weights: Dict[Tuple[int, int], float] = defaultdict(float)
+    for t, ids in postings.items():
+        w = idf[t]
+        for a, i in enumerate(ids):
+            for j in ids[a + 1 :]:
+                weights[(i, j)] += w
+    return [(i, j, w) for (i, j), w in sorted(weights.items())]
+
+
 def build_graph(posts: List[Dict[str, Any]], top_k_edges: int = 6) -> nx.Graph:
     g = nx.Graph()
     for p in posts:
@@ -154,56 +255,128 @@ def build_graph(posts: List[Dict[str, Any]], top_k_edges: int = 6) -> nx.Graph:
 
     idf = {t: math.log((n_posts + 1) / (df + 1)) + 1 for t, df in tag_df.items()}
 
-    edge_w: Dict[Tuple[int, int], float] = defaultdict(float)
-    edge_meta: Dict[Tuple[int, int], List[str]] = defaultdict(list)
-
-    # tag similarity (IDF-weighted)
-    for i, a in enumerate(posts):
-        for b in posts[i + 1 :]:
-            shared = set(a.get("tags") or []) & set(b.get("tags") or [])
-            shared = {t for t in shared if t not in ignored}
-            if not shared:
-                continue
-            u, v = a["post_id"], b["post_id"]
-            key = tuple(sorted((u, v)))
-            edge_w[key] += float(sum(idf[t] for t in shared))
-            edge_meta[key] = sorted(shared)
-
-    # explicit internal links (boost)
-    for u, v in _build_internal_link_edges(posts):
-        key = tuple(sorted((u, v)))
-        edge_w[key] += 3.0
-        edge_meta[key] = (edge_meta.get(key, []) or []) + ["linked"]
-
-    # keep top K edges per node
-    node_edges: Dict[int, List[Tuple[int, float]]] = defaultdict(list)
-    for (u, v), w in edge_w.items():
-        node_edges[u].append((v, w))
-        node_edges[v].append((u, w))
-
-    kept: Set[Tuple[int, int]] = set()
-    for u, lst in node_edges.items():
-        for v, _w in sorted(lst, key=lambda x: x[1], reverse=True)[:top_k_edges]:
-            kept.add(tuple(sorted((u, v))))
-
-    for u, v in kept:
-        g.add_edge(u, v, weight=edge_w[(u, v)], tags=edge_meta[(u, v)])
+    # tag similarity (IDF-weighted); each post's tag set is built once, with
+    # ignored tags removed, and shared by the weights and the edge labels
+    post_tags = [
+        frozenset(t for t in (p.get("tags") or []) if t not in ignored) for p in posts
+    ]
+    if sparse is not None:
+        pair_weights = _shared_tag_weights_sparse(post_tags, idf)
+    else:
+        pair_weights = _shared_tag_weights_postings(post_tags, idf)
+
+    # explicit internal links (boost); pairs are post indices with src < dst
+    index = {p["post_id"]: i for i, p in enumerate(posts)}
+    link_pairs = [
+        (min(index[u], index[v]), max(index[u], index[v]))
+        for u, v in _build_internal_link_edges(posts)
+    ]
+
+    src = np.array(
+        [i for i, _j, _w in pair_weights] + [i for i, _j in link_pairs], dtype=np.int32
+    )
+    dst = np.array(
+        [j for _i, j, _w in pair_weights] + [j for _i, j in link_pairs], dtype=np.int32
+    )
+    w_arr = np.array(
+        [w for _i, _j, w in pair_weights] + [3.0] * len(link_pairs), dtype=np.float64
+    )
+    edge_keys, first, inv = np.unique(
+        src.astype(np.int64) * n_posts + dst, return_index=True, return_inverse=True
+    )
+    # number edges by first appearance so top-K ties break as they always have
+    order = np.argsort(first, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    edge_keys, inv = edge_keys[order], rank[inv]
+    edge_w = np.zeros(len(edge_keys))
+    np.add.at(edge_w, inv, w_arr)
+    edge_src = (edge_keys // max(n_posts, 1)).tolist()
+    edge_dst = (edge_keys % max(n_posts, 1)).tolist()
+    linked = Counter(link_pairs)
+
+    # keep top K edges per node: group edge ends by node in edge order, then
+    # take the K heaviest per node, ties going to the earlier edge
+    ends = np.empty(2 * len(edge_keys), dtype=np.int64)
+    ends[0::2] = edge_src
+    ends[1::2] = edge_dst
+    by_node = np.argsort(ends, kind="stable")
+    node_edge_ids = by_node // 2
+    node_edge_w = edge_w[node_edge_ids]
+    bounds = np.flatnonzero(np.diff(ends[by_node])) + 1
+    kept = np.zeros(len(edge_keys), dtype=bool)
+    if top_k_edges > 0:
+        for es, ws in zip(np.split(node_edge_ids, bounds), np.split(node_edge_w, bounds)):
+            if len(ws) > top_k_edges:
+                cut = len(ws) - top_k_edges
+                t = np.partition(ws, cut)[cut]
+                heavier = ws > t
+                ties = np.flatnonzero(ws == t)[: top_k_edges - np.count_nonzero(heavier)]
+                es = np.concatenate((es[heavier], es[ties]))
+            kept[es] = True
+
+    # shared-tag labels are only worked out for the edges that survive
+    for e in np.flatnonzero(kept).tolist():
+        i, j = edge_src[e], edge_dst[e]
+        meta = sorted(post_tags[i] & post_tags[j])
+        meta.extend(["linked"] * linked[(i, j)])
+        g.add_edge(
+            posts[i]["post_id"], posts[j]["post_id"], weight=float(edge_w[e]), tags=meta
+        )
 
     return g
 
 
+def _igraph_layout(g: nx.Graph, seed: int = 42) -> Dict[int, Tuple[float, float]]:
+    """Weighted Fruchterman-Reingold layout computed by igraph."""
+    nodes = list(g.nodes())
+    if not nodes:
+        return {}
+    node_idx = {node: i for i, node in enumerate(nodes)}
+    edges = [(node_idx[u], node_idx[v]) for u, v in g.edges()]
+    weights = [float(w) for _u, _v, w in g.edges(data="weight", default=1.0)]
+    ig_g = ig.Graph(n=len(nodes), edges=edges, edge_attrs={"weight": weights})
+    rng = np.random.default_rng(seed)
+    # FR's displacement steps draw from igraph's RNG, which is the random
+    # module unless a caller has set another. igraph has no getter for its
+    # generator, so seed the module and put its state back rather than
+    # swapping the generator out from under the caller.
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        coords = ig_g.layout_fruchterman_reingold(
+            niter=200, weights="weight", seed=rng.random((len(nodes), 2)).tolist()
+        )
+    finally:
+        random.setstate(state)
+    return {node: tuple(coords[i]) for i, node in enumerate(nodes)}
+
+
 def _layout(g: nx.Graph) -> Dict[int, Tuple[float, float]]:
-    pos = nx.spring_layout(g, k=0.6, iterations=200, seed=42, weight="weight")
-    xs = np.array([pos[n][0] for n in g.nodes()])
-    ys = np.array([pos[n][1] for n in g.nodes()])
-    xs = (xs - xs.mean()) / (xs.std() if xs.std() else 1.0)
-    ys = (ys - ys.mean()) / (ys.std() if ys.std() else 1.0)
-    return {n: (float(xs[i]), float(ys[i])) for i, n in enumerate(g.nodes())}
+    if ig is not None:
+        pos = _igraph_layout(g, seed=42)
+    else:
+        pos = nx.spring_layout(g, k=0.6, iterations=200, seed=42, weight="weight")
+    nodes = list(g.nodes())
+    if not nodes:
+        return {}
+    xy = np.fromiter(
+        (v for n in nodes for v in pos[n]), dtype=np.float64, count=2 * len(nodes)
+    ).reshape(-1, 2)
+    xy -= xy.mean(axis=0)
+    std = xy.std(axis=0)
+    std[std == 0] = 1.0
+    xy /= std
+    return dict(zip(nodes, map(tuple, xy.tolist())))
 
 
 def _date_disp(s: Optional[str]) -> str:
     if not s:
         return ""
+    # WXR dates are "YYYY-MM-DD HH:MM:SS": the date is already the first 10
+    # characters, and anything that fails to parse falls back to those anyway
+    if len(s) >= 10 and s[4] == "-" and s[7] == "-":
+        return s[:10]
     try:
         d = dt.datetime.fromisoformat(s)
         return d.strftime("%Y-%m-%d")
@@ -211,38 +384,41 @@ def _date_disp(s: Optional[str]) -> str:
         return s[:10]
 
 
+def _dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj)
+
+
 def write_html(g: nx.Graph, out_path: Path) -> None:
     pos = _layout(g)
     deg = dict(g.degree())
 
-    nodes: List[Dict[str, Any]] = []
-    for n, data in g.nodes(data=True):
-        nodes.append(
-            {
-                "id": n,
-                "title": data.get("title") or "",
-                "link": data.get("link") or "",
-                "status": data.get("status") or "",
-                "date": _date_disp(data.get("post_date")),
-                "tags": data.get("tags") or [],
-                "x": pos[n][0],
-                "y": pos[n][1],
-                "degree": int(deg.get(n, 0)),
-            }
-        )
+    # one array per field (SoA); edges refer to nodes by position
+    node_ids = list(g.nodes())
+    attrs = [data for _n, data in g.nodes(data=True)]
+    node_idx = {n: i for i, n in enumerate(node_ids)}
+    nodes: Dict[str, List[Any]] = {
+        "id": node_ids,
+        "title": [d.get("title") or "" for d in attrs],
+        "link": [d.get("link") or "" for d in attrs],
+        "status": [d.get("status") or "" for d in attrs],
+        "date": [_date_disp(d.get("post_date")) for d in attrs],
+        "tags": [d.get("tags") or [] for d in attrs],
+        "x": [round(pos[n][0], 4) for n in node_ids],
+        "y": [round(pos[n][1], 4) for n in node_ids],
+        "degree": [int(deg.get(n, 0)) for n in node_ids],
+    }
 
-    edges: List[Dict[str, Any]] = []
-    for u, v, data in g.edges(data=True):
-        edges.append(
-            {
-                "source": u,
-                "target": v,
-                "weight": float(data.get("weight", 1.0)),
-                "tags": data.get("tags") or [],
-            }
-        )
+    edge_list = list(g.edges(data=True))
+    edges: Dict[str, List[Any]] = {
+        "source": [node_idx[u] for u, _v, _d in edge_list],
+        "target": [node_idx[v] for _u, v, _d in edge_list],
+        "weight": [float(d.get("weight", 1.0)) for _u, _v, d in edge_list],
+        "tags": [d.get("tags") or [] for _u, _v, d in edge_list],
+    }
 
-    payload = json.dumps({"nodes": nodes, "edges": edges})
+    payload = _dumps({"nodes": nodes, "edges": edges})
     plotly_cdn = "https://cdn.plot.ly/plotly-2.27.0.min.js"
 
     html = f"""<!doctype html>
@@ -305,26 +481,32 @@ def write_html(g: nx.Graph, out_path: Path) -> None:
 
 <script>
 const DATA = {payload};
-
-function buildPlot(filteredNodeIds=null, highlightIds=new Set()) {{
-  const nodes = DATA.nodes.filter(n => {{
-    if (filteredNodeIds && !filteredNodeIds.has(n.id)) return false;
-    return true;
-  }});
-  const nodeIdSet = new Set(nodes.map(n=>n.id));
-  const edges = DATA.edges.filter(e => nodeIdSet.has(e.source) && nodeIdSet.has(e.target));
-
-  const edgeX = [];
-  const edgeY = [];
-  for (const e of edges) {{
-    const s = nodes.find(n => n.id === e.source);
-    const t = nodes.find(n => n.id === e.target);
-    if (!s || !t) continue;
-    edgeX.push(s.x, t.x, null);
-    edgeY.push(s.y, t.y, null);
+const NODES = DATA.nodes;
+const EDGES = DATA.edges;
+const N = NODES.id.length;
+let traceNodes = [];       // node indices behind each status trace on screen
+let plottedFilter = null;  // status checkboxes the current plot was built for
+
+function buildPlot(visible=null, highlight=new Set()) {{
+  const shown = i => !visible || visible.has(i);
+
+  // sized for every edge up front, then trimmed to the ones drawn
+  const E = EDGES.source.length;
+  const edgeX = new Array(3 * E);
+  const edgeY = new Array(3 * E);
+  let k = 0;
+  for (let e = 0; e < E; e++) {{
+    const s = EDGES.source[e], t = EDGES.target[e];
+    if (!shown(s) || !shown(t)) continue;
+    edgeX[k] = NODES.x[s]; edgeX[k + 1] = NODES.x[t]; edgeX[k + 2] = null;
+    edgeY[k] = NODES.y[s]; edgeY[k + 1] = NODES.y[t]; edgeY[k + 2] = null;
+    k += 3;
   }}
+  edgeX.length = k;
+  edgeY.length = k;
 
   const edgeTrace = {{
+    type: 'scattergl',
     x: edgeX, y: edgeY,
     mode: 'lines',
     hoverinfo: 'none',
@@ -333,21 +515,28 @@ function buildPlot(filteredNodeIds=null, highlightIds=new Set()) {{
   }};
 
   function nodeTraceForStatus(status) {{
-    const ns = nodes.filter(n => n.status === status);
+    const ns = [];
+    for (let i = 0; i < N; i++) {{
+      if (NODES.status[i] === status && shown(i)) ns.push(i);
+    }}
     return {{
-      x: ns.map(n=>n.x),
-      y: ns.map(n=>n.y),
+      type: 'scattergl',
+      x: ns.map(i => NODES.x[i]),
+      y: ns.map(i => NODES.y[i]),
       mode: 'markers+text',
-      text: ns.map(n => n.title.length > 28 ? n.title.slice(0,28) + '…' : n.title),
+      text: ns.map(i => {{ const t = NODES.title[i]; return t.length > 28 ? t.slice(0,28) + '…' : t; }}),
       textposition: 'top center',
-      hovertext: ns.map(n => `<b>${{n.title}}</b><br>${{n.date}}<br>Status: ${{n.status}}<br>Degree: ${{n.degree}}`),
+      hovertext: ns.map(i =>
+        `<b>${{NODES.title[i]}}</b><br>${{NODES.date[i]}}` +
+        `<br>Status: ${{NODES.status[i]}}<br>Degree: ${{NODES.degree[i]}}`
+      ),
       hoverinfo: 'text',
       customdata: ns,
       marker: {{
-        size: ns.map(n => 10 + n.degree * 2),
+        size: ns.map(i => 10 + NODES.degree[i] * 2),
         opacity: 0.9,
         line: {{
-          width: ns.map(n => highlightIds.has(n.id) ? 3 : 1)
+          width: ns.map(i => highlight.has(i) ? 3 : 1)
         }}
       }},
       name: status
@@ -359,6 +548,7 @@ function buildPlot(filteredNodeIds=null, highlightIds=new Set()) {{
     nodeTraceForStatus('future'),
     nodeTraceForStatus('private')
   ];
+  traceNodes = traces.slice(1).map(t => t.customdata);
 
   const layout = {{
     margin: {{l:10,r:10,t:10,b:10}},
@@ -379,23 +569,25 @@ function buildPlot(filteredNodeIds=null, highlightIds=new Set()) {{
   plotDiv.on('plotly_click', function(evt) {{
     if (!evt.points || !evt.points.length) return;
     const pt = evt.points[0];
-    if (!pt.customdata) return;
+    if (pt.customdata === undefined) return;
     renderDetails(pt.customdata);
   }});
 
   plotDiv.on('plotly_doubleclick', function() {{
     const last = window.__selectedNode;
-    if (last && last.link) window.open(last.link, '_blank');
+    if (last !== undefined && NODES.link[last]) window.open(NODES.link[last], '_blank');
   }});
 }}
 
-function renderDetails(n) {{
-  window.__selectedNode = n;
-  const tagsHtml = (n.tags || []).slice(0, 50).map(t => `<span class="pill">${{escapeHtml(t)}}</span>`).join(' ');
+function renderDetails(i) {{
+  window.__selectedNode = i;
+  const tagsHtml = (NODES.tags[i] || []).slice(0, 50)
+    .map(t => `<span class="pill">${{escapeHtml(t)}}</span>`)
+    .join(' ');
   document.getElementById('details').innerHTML = `
-    <div class="post-title">${{escapeHtml(n.title)}}</div>
-    <div class="muted">${{escapeHtml(n.date)}} · status: <b>${{escapeHtml(n.status)}}</b></div>
-    <div class="row"><a href="${{n.link}}" target="_blank">Open post</a></div>
+    <div class="post-title">${{escapeHtml(NODES.title[i])}}</div>
+    <div class="muted">${{escapeHtml(NODES.date[i])}} · status: <b>${{escapeHtml(NODES.status[i])}}</b></div>
+    <div class="row"><a href="${{NODES.link[i]}}" target="_blank">Open post</a></div>
     <div class="row"><strong>Tags</strong><div>${{tagsHtml || '<span class="muted">No tags</span>'}}</div></div>
   `;
 }}
@@ -410,10 +602,11 @@ function currentFilterSet() {{
   const showPrivate = document.getElementById('f_private').checked;
 
   const ids = new Set();
-  for (const n of DATA.nodes) {{
-    if (n.status === 'publish' && showPublish) ids.add(n.id);
-    if (n.status === 'future' && showFuture) ids.add(n.id);
-    if (n.status === 'private' && showPrivate) ids.add(n.id);
+  for (let i = 0; i < N; i++) {{
+    const status = NODES.status[i];
+    if (status === 'publish' && showPublish) ids.add(i);
+    if (status === 'future' && showFuture) ids.add(i);
+    if (status === 'private' && showPrivate) ids.add(i);
   }}
   return ids;
 }}
@@ -423,12 +616,21 @@ function applyFiltersAndSearch() {{
   const q = document.getElementById('search').value.trim().toLowerCase();
   const highlight = new Set();
   if (q) {{
-    for (const n of DATA.nodes) {{
-      if (!ids.has(n.id)) continue;
-      if ((n.title || '').toLowerCase().includes(q)) highlight.add(n.id);
+    for (const i of ids) {{
+      if ((NODES.title[i] || '').toLowerCase().includes(q)) highlight.add(i);
     }}
   }}
-  buildPlot(ids, highlight);
+  // a search only changes the highlight rings, so restyle those in place
+  // and rebuild the scene only when the status filter changes
+  const filterKey = ['f_publish', 'f_future', 'f_private'].map(id => document.getElementById(id).checked).join();
+  if (filterKey === plottedFilter) {{
+    Plotly.restyle('plot', {{
+      'marker.line.width': traceNodes.map(ns => ns.map(i => highlight.has(i) ? 3 : 1))
+    }}, [1, 2, 3]);
+  }} else {{
+    buildPlot(ids, highlight);
+    plottedFilter = filterKey;
+  }}
   window.__highlight = highlight;
 }}
 
@@ -442,6 +644,7 @@ document.getElementById('btn_reset').addEventListener('click', function() {{
   document.getElementById('f_publish').checked = true;
   document.getElementById('f_future').checked = true;
   document.getElementById('f_private').checked = true;
+  plottedFilter = null;  // rebuild so a zoomed-in view goes back to autorange
   applyFiltersAndSearch();
 }});
 
@@ -449,9 +652,9 @@ document.getElementById('btn_zoom').addEventListener('click', function() {{
   const highlight = window.__highlight || new Set();
   if (!highlight.size) return;
   const ids = currentFilterSet();
-  const nodes = DATA.nodes.filter(n => ids.has(n.id) && highlight.has(n.id));
-  if (!nodes.length) return;
-  const xs = nodes.map(n=>n.x), ys = nodes.map(n=>n.y);
+  const matches = [...highlight].filter(i => ids.has(i));
+  if (!matches.length) return;
+  const xs = matches.map(i => NODES.x[i]), ys = matches.map(i => NODES.y[i]);
   const xmin = Math.min(...xs), xmax = Math.max(...xs);
   const ymin = Math.min(...ys), ymax = Math.max(...ys);
   Plotly.relayout('plot', {{